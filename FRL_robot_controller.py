@@ -6,15 +6,183 @@ Serial communication controller for AR4 robot arm.
 Handles connection, jogging, position feedback, and movement commands.
 """
 
+import array
+import os
+import queue
+import re
+import selectors
 import time
 import threading
 import serial
 import serial.tools.list_ports
 
+# Precompiled AR4 position frame pattern. The robot sends all data in one line:
+# A{j1}B{j2}C{j3}D{j4}E{j5}F{j6}G{X}H{Y}I{Z}J{Rz}K{Ry}L{Rx}M...P{j7}Q{j8}R{j9}
+# One C-level regex pass replaces the old per-marker find()/slice chain.
+# The protocol is pure ASCII, so frames are matched as bytes - no UTF-8
+# decode on the hot path (float() accepts ASCII bytes directly).
+_POSITION_RE = re.compile(
+    rb'A(-?[\d.]+)B(-?[\d.]+)C(-?[\d.]+)D(-?[\d.]+)E(-?[\d.]+)F(-?[\d.]+)'
+    rb'G(-?[\d.]+)H(-?[\d.]+)I(-?[\d.]+)J(-?[\d.]+)K(-?[\d.]+)L(-?[\d.]+)'
+    rb'(?:M[^P]*P(-?[\d.]+))?'
+)
+
+
+class SerialReactor:
+    """Single background thread servicing all registered serial ports.
+
+    Replaces the one-read-thread-per-controller design: every port is
+    registered with a readable-callback and one selector loop blocks on
+    readiness for all of them, so there is no per-device busy-sleep and
+    only one reader thread total.
+    """
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._running = False
+        self._tick_callbacks = []
+
+        # Self-pipe so other threads can wake the selector on demand
+        # (new registrations, pending TX) - lets the loop block in the
+        # kernel instead of waking on a short timer
+        self._wake_r, self._wake_w = os.pipe()
+        # os.set_blocking is missing on Windows before Python 3.12; the
+        # pipe only needs to be non-blocking for _drain_wake, which
+        # already tolerates a short read, so skip it there
+        if hasattr(os, 'set_blocking'):
+            os.set_blocking(self._wake_r, False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ,
+                                self._drain_wake)
+
+    def _drain_wake(self, fd):
+        """Consume wakeup bytes from the self-pipe."""
+        try:
+            os.read(self._wake_r, 4096)
+        except OSError:
+            pass
+
+    def wakeup(self):
+        """Wake the reactor loop immediately (e.g. to flush pending TX)."""
+        try:
+            os.write(self._wake_w, b'\x00')
+        except OSError:
+            pass
+
+    def register(self, ser, callback):
+        """Register a serial port; callback(ser) runs when data is ready.
+
+        Raises OSError on platforms where serial ports have no usable
+        fileno (callers fall back to a dedicated read thread).
+        """
+        with self._lock:
+            self._selector.register(ser, selectors.EVENT_READ, callback)
+            if not self._running:
+                self._running = True
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        self.wakeup()
+
+    def unregister(self, ser):
+        """Remove a serial port from the reactor."""
+        with self._lock:
+            try:
+                self._selector.unregister(ser)
+            except (KeyError, ValueError):
+                pass
+
+    def add_tick_callback(self, cb):
+        """Run cb() once per reactor iteration (used for TX flushing)."""
+        with self._lock:
+            if cb not in self._tick_callbacks:
+                self._tick_callbacks.append(cb)
+
+    def remove_tick_callback(self, cb):
+        """Stop running cb() per iteration."""
+        with self._lock:
+            try:
+                self._tick_callbacks.remove(cb)
+            except ValueError:
+                pass
+
+    def _run(self):
+        """Reactor loop: block until a port is readable or a wakeup."""
+        while self._running:
+            try:
+                # The self-pipe wakes us for TX work, so the timeout is
+                # only a backstop for re-checking _running
+                events = self._selector.select(timeout=0.5)
+            except OSError:
+                # A port was closed out from under us - retry
+                time.sleep(0.02)
+                continue
+            for key, _ in events:
+                try:
+                    key.data(key.fileobj)
+                except Exception:
+                    pass
+            for cb in tuple(self._tick_callbacks):
+                try:
+                    cb()
+                except Exception:
+                    pass
+
+
+# Shared reactor for all robot serial ports (thread starts lazily)
+_reactor = SerialReactor()
+
+
+# Cached serial-port enumeration: comports() walks the OS device tree
+# on every call, but the set of ports rarely changes mid-session
+_ports_cache = (0.0, [], [])
+
+
+def cached_comports(ttl=1.0):
+    """Return serial.tools.list_ports.comports(), cached for ttl seconds."""
+    global _ports_cache
+    now = time.monotonic()
+    stamp, ports, _ = _ports_cache
+    if now - stamp >= ttl:
+        ports = list(serial.tools.list_ports.comports())
+        # Lowercase each description once per scan; device classification
+        # re-reads these without re-lowering per call
+        descs = [(p.device, (p.description or '').lower()) for p in ports]
+        _ports_cache = (now, ports, descs)
+    return ports
+
+
+def cached_port_descriptions(ttl=1.0):
+    """Return [(device, lowercased description)] from the cached scan."""
+    cached_comports(ttl)
+    return _ports_cache[2]
+
+
+def _jog_command(prefix, code, speed, accel, decel, cache):
+    """Return the jog command line as bytes, memoized per parameter set.
+
+    Jogging reuses a handful of (code, speed, accel, decel) combinations
+    over and over; formatting each once and caching the bytes avoids
+    per-sample f-string formatting and encoding.
+    """
+    key = (prefix, code, speed, accel, decel)
+    cmd = cache.get(key)
+    if cmd is None:
+        cmd = cache[key] = prefix + b'%dS%dA%dD%d\n' % (code, speed, accel, decel)
+    return cmd
+
 
 class RobotController:
     """Controller for AR4 robot via serial."""
 
+    # Max bytes buffered while waiting for a line terminator; far larger
+    # than any AR4 frame, so hitting it means the stream is garbage
+    RX_BUFFER_LIMIT = 8192
+
+    # How long a byte-identical jog repeat is suppressed; kept under the
+    # GUI's 0.5 s jog keepalive so periodic refreshes still go out
+    _JOG_DEDUP_TTL = 0.4
+
     def __init__(self, name="Robot", port=None, baudrate=115200):
         self.name = name
         self.port = port
@@ -24,25 +192,55 @@ class RobotController:
         self.reading = False
         self.read_thread = None
 
-        # Current position (from encoder feedback)
-        self.joints = [0.0] * 6  # J1-J6
+        # Current position (from encoder feedback).
+        # Fixed-size double arrays: parsed values are written in place each
+        # frame instead of reallocating Python lists in the read loop.
+        self.joints = array.array('d', [0.0] * 6)  # J1-J6
         self.j7_pos = 0.0  # Linear track
-        self.cartesian = [0.0] * 6  # X, Y, Z, Rx, Ry, Rz
+        self.cartesian = array.array('d', [0.0] * 6)  # X, Y, Z, Rx, Ry, Rz
 
         # Jogging state
         self.jogging = False
-        self.last_response = ""
+        self.last_response = b""  # most recent raw line (bytes)
+
+        # True when the shared SerialReactor services this port
+        self._uses_reactor = False
+
+        # Non-position lines (command acks) land here for move_and_wait.
+        # While _waiting is set, position-shaped lines are delivered too:
+        # the Teensy's move-complete reply is position-formatted, so
+        # routing it only to _apply_position would starve the waiter.
+        self._resp_q = queue.Queue()
+        self._waiting = False
+
+        # Persistent RX assembly buffer: chunk reads land here and
+        # complete lines are split off, replacing per-byte readline().
+        # Bounded so line-less garbage can't grow it without limit.
+        self._rxbuf = bytearray()
+
+        # Coalesced outbound jog commands: newest command per axis key,
+        # flushed in one write per reactor tick
+        self._tx_lock = threading.Lock()
+        self._pending_jogs = {}
+
+        # Memoized preformatted jog command bytes
+        self._jog_cache = {}
+        self._last_jog = {}
+
+        # Outbound command queue drained by a dedicated writer thread,
+        # so serial write/flush stalls never block the caller (the Xbox
+        # poll thread during jogging)
+        self._tx_q = queue.SimpleQueue()
+        self._write_thread = None
 
     def find_teensy(self, exclude_ports=None):
         """Auto-detect Teensy port for AR4."""
         exclude = exclude_ports or []
-        ports = serial.tools.list_ports.comports()
-        for port in ports:
-            if port.device in exclude:
+        for device, desc in cached_port_descriptions():
+            if device in exclude:
                 continue
-            desc = port.description.lower() if port.description else ''
             if 'teensy' in desc:
-                return port.device
+                return device
         return None
 
     def connect(self):
@@ -51,108 +249,235 @@ class RobotController:
             return False
         try:
             self.serial = serial.Serial(self.port, self.baudrate, timeout=0.1)
+            try:
+                # Ask the USB-serial driver for low-latency mode so RX
+                # bytes surface immediately (Linux; no-op elsewhere)
+                self.serial.set_low_latency_mode(True)
+            except (NotImplementedError, ValueError, OSError):
+                pass
             time.sleep(0.5)
             self.serial.reset_input_buffer()
             self.connected = True
             self.reading = True
-            self.read_thread = threading.Thread(target=self._read_loop, daemon=True)
-            self.read_thread.start()
+            self._start_reader()
+            self._write_thread = threading.Thread(target=self._write_loop, daemon=True)
+            self._write_thread.start()
             return True
         except serial.SerialException as e:
             print(f"[{self.name}] Connection error: {e}")
             return False
 
+    def _start_reader(self):
+        """Attach this port to the shared reactor (thread fallback)."""
+        try:
+            _reactor.register(self.serial, self._on_readable)
+            self._uses_reactor = True
+            _reactor.add_tick_callback(self._flush_jogs)
+        except (OSError, ValueError):
+            # No selectable fileno on this platform - dedicated thread
+            self._uses_reactor = False
+            self.read_thread = threading.Thread(target=self._read_loop, daemon=True)
+            self.read_thread.start()
+
+    def _stop_reader(self):
+        """Detach this port from the reactor / stop the fallback thread."""
+        self.reading = False
+        if self._uses_reactor and self.serial:
+            _reactor.remove_tick_callback(self._flush_jogs)
+            _reactor.unregister(self.serial)
+
     def disconnect(self):
         """Disconnect from robot."""
-        self.reading = False
+        self._stop_reader()
         self.stop_jog()
+        if self._write_thread is not None:
+            # Let queued commands (including the stop above) drain
+            self._tx_q.put(None)
+            self._write_thread.join(timeout=0.5)
+            self._write_thread = None
         if self.serial and self.serial.is_open:
+            self.flush()
             self.serial.close()
         self.connected = False
 
+    def _handle_line(self, line):
+        """Route one received line (bytes): position frame or ack."""
+        self.last_response = line
+        m = _POSITION_RE.match(line)
+        if m is not None:
+            self._apply_position(m)
+        # Deliver the line (position-shaped or not - the move-complete
+        # reply is itself a position frame) only while move_and_wait is
+        # actually blocked; unsolicited chatter between waits would
+        # otherwise pile up in the queue for the life of the connection
+        if self._waiting:
+            self._resp_q.put(line)
+
+    def _consume_rx(self, data):
+        """Append a chunk of RX bytes and handle any completed lines."""
+        self._rxbuf.extend(data)
+        if len(self._rxbuf) > self.RX_BUFFER_LIMIT:
+            # No terminator within the cap - discard and resynchronize
+            # on the next newline
+            del self._rxbuf[:]
+        while True:
+            nl = self._rxbuf.find(b'\n')
+            if nl < 0:
+                break
+            raw = self._rxbuf[:nl]
+            del self._rxbuf[:nl + 1]
+            line = raw.strip()
+            if line:
+                self._handle_line(line)
+
+    def _on_readable(self, ser):
+        """Reactor callback: drain pending serial data in one chunk."""
+        if not self.reading:
+            return
+        try:
+            data = ser.read(ser.in_waiting or 1)
+            if data:
+                self._consume_rx(data)
+        except (serial.SerialException, OSError):
+            # Port died (unplugged) - stop feeding the reactor
+            self.connected = False
+            self._stop_reader()
+
     def _read_loop(self):
-        """Background thread to read serial responses."""
-        while self.reading and self.serial and self.serial.is_open:
+        """Background thread to read serial responses (reactor fallback)."""
+        # Hoist hot references out of the loop - attribute lookups on
+        # self/serial add up at byte-arrival rate
+        ser = self.serial
+        read = ser.read
+        consume = self._consume_rx
+        while self.reading and ser.is_open:
             try:
-                if self.serial.in_waiting:
-                    line = self.serial.readline().decode('utf-8', errors='ignore').strip()
-                    if line:
-                        self.last_response = line
-                        self._parse_response(line)
-            except:
-                pass
-            time.sleep(0.005)
+                # Block in the kernel until a byte arrives (bounded by
+                # the port timeout so stop requests are still honored),
+                # then drain whatever else is pending in one read
+                first = read(1)
+                if not first:
+                    continue
+                waiting = ser.in_waiting
+                if waiting:
+                    consume(first + read(waiting))
+                else:
+                    consume(first)
+            except (serial.SerialException, OSError):
+                # Dead port (e.g. cable unplugged): exit instead of
+                # spinning on a read that will never succeed again
+                self.connected = False
+                break
+            except ValueError:
+                # Port closed out from under us mid-read
+                break
 
     def _parse_response(self, line):
         """Parse position feedback from robot."""
-        # AR4 sends ALL data in one line:
-        # A{j1}B{j2}C{j3}D{j4}E{j5}F{j6}G{X}H{Y}I{Z}J{Rz}K{Ry}L{Rx}M...P{j7}Q{j8}R{j9}
+        m = _POSITION_RE.match(line)
+        if m is not None:
+            self._apply_position(m)
+
+    def _apply_position(self, m):
+        """Store the fields of a matched position frame."""
         try:
-            if 'A' in line and 'B' in line:
-                # Parse using index-based extraction like FRL.py
-                j1_idx = line.find('A')
-                j2_idx = line.find('B')
-                j3_idx = line.find('C')
-                j4_idx = line.find('D')
-                j5_idx = line.find('E')
-                j6_idx = line.find('F')
-                x_idx = line.find('G')
-                y_idx = line.find('H')
-                z_idx = line.find('I')
-                rz_idx = line.find('J')
-                ry_idx = line.find('K')
-                rx_idx = line.find('L')
-                m_idx = line.find('M')
-                p_idx = line.find('P')
-                q_idx = line.find('Q')
-                r_idx = line.find('R')
-
-                # Parse joints (A-F)
-                if j1_idx >= 0 and j2_idx > j1_idx:
-                    self.joints[0] = float(line[j1_idx+1:j2_idx])
-                if j2_idx >= 0 and j3_idx > j2_idx:
-                    self.joints[1] = float(line[j2_idx+1:j3_idx])
-                if j3_idx >= 0 and j4_idx > j3_idx:
-                    self.joints[2] = float(line[j3_idx+1:j4_idx])
-                if j4_idx >= 0 and j5_idx > j4_idx:
-                    self.joints[3] = float(line[j4_idx+1:j5_idx])
-                if j5_idx >= 0 and j6_idx > j5_idx:
-                    self.joints[4] = float(line[j5_idx+1:j6_idx])
-                if j6_idx >= 0 and x_idx > j6_idx:
-                    self.joints[5] = float(line[j6_idx+1:x_idx])
-
-                # Parse Cartesian (G=X, H=Y, I=Z, J=Rz, K=Ry, L=Rx)
-                if x_idx >= 0 and y_idx > x_idx:
-                    self.cartesian[0] = float(line[x_idx+1:y_idx])  # X
-                if y_idx >= 0 and z_idx > y_idx:
-                    self.cartesian[1] = float(line[y_idx+1:z_idx])  # Y
-                if z_idx >= 0 and rz_idx > z_idx:
-                    self.cartesian[2] = float(line[z_idx+1:rz_idx])  # Z
-                if rz_idx >= 0 and ry_idx > rz_idx:
-                    self.cartesian[5] = float(line[rz_idx+1:ry_idx])  # Rz
-                if ry_idx >= 0 and rx_idx > ry_idx:
-                    self.cartesian[4] = float(line[ry_idx+1:rx_idx])  # Ry
-                if rx_idx >= 0 and m_idx > rx_idx:
-                    self.cartesian[3] = float(line[rx_idx+1:m_idx])  # Rx
-
-                # Parse J7 (P index)
-                if p_idx >= 0 and q_idx > p_idx:
-                    self.j7_pos = float(line[p_idx+1:q_idx])
+            g = m.groups()
+
+            # One C-level conversion pass over the captured fields
+            vals = list(map(float, g[:12]))
+
+            # Joints (A-F)
+            self.joints[:] = array.array('d', vals[:6])
+
+            # Cartesian (G=X, H=Y, I=Z, J=Rz, K=Ry, L=Rx)
+            x, y, z, rz, ry, rx = vals[6:]
+            self.cartesian[:] = array.array('d', (x, y, z, rx, ry, rz))
+
+            # J7 (P marker)
+            if g[12] is not None:
+                self.j7_pos = float(g[12])
 
         except Exception:
             pass
 
     def send(self, command):
-        """Send a command to the robot."""
+        """Queue a command (str or bytes) for the writer thread."""
         if not self.connected:
             return False
+        if isinstance(command, str):
+            command = command.encode()
+        cmd = command if command.endswith(b'\n') else command + b'\n'
+        self._tx_q.put(cmd)
+        return True
+
+    def flush(self):
+        """Block until queued bytes reach the wire (one-off sync point)."""
         try:
-            cmd = command if command.endswith('\n') else command + '\n'
-            self.serial.write(cmd.encode())
             self.serial.flush()
-            return True
-        except:
+        except Exception:
+            pass
+
+    def _write_loop(self):
+        """Writer thread: drain queued commands to the serial port."""
+        while True:
+            cmd = self._tx_q.get()
+            if cmd is None:
+                break
+            try:
+                # No flush(): tcdrain blocks until the UART empties
+                # (~1 ms per 10 bytes at 115200) and the newline already
+                # frames each command for the Teensy
+                self.serial.write(cmd)
+            except Exception:
+                pass
+
+    def send_jog(self, axis_key, command):
+        """Queue a high-rate jog command (bytes) for coalesced transmission.
+
+        Only the newest command per axis key survives until the next
+        reactor tick, when all pending jogs go out in a single write.
+        Without the reactor (fallback thread) this sends immediately.
+        """
+        if not self.connected:
             return False
+        # A byte-identical repeat for the same axis adds nothing but
+        # link traffic at stick-sample rate, so suppress it - but only
+        # briefly: the GUI deliberately resends the held jog every
+        # 0.5 s as a keepalive, and those refreshes must hit the wire
+        now = time.monotonic()
+        prev = self._last_jog.get(axis_key)
+        if (prev is not None and prev[0] == command
+                and now - prev[1] < self._JOG_DEDUP_TTL):
+            return True
+        self._last_jog[axis_key] = (command, now)
+        if not self._uses_reactor:
+            return self.send(command)
+        with self._tx_lock:
+            self._pending_jogs[axis_key] = command
+        _reactor.wakeup()
+        return True
+
+    def _flush_jogs(self):
+        """Reactor tick callback: hand all pending jogs to the writer.
+
+        The batch goes through _tx_q rather than straight to the port:
+        the writer thread is the single serial writer, so jog bytes can
+        never interleave with a send() mid-line, and a batch extracted
+        just before stop_jog/emergency_stop clears the pending map is
+        still queued ahead of the "S"/"ES" it races with.
+        """
+        with self._tx_lock:
+            if not self._pending_jogs:
+                return
+            batch = b''.join(self._pending_jogs.values())
+            self._pending_jogs.clear()
+        self._tx_q.put(batch)
+
+    def _clear_pending_jogs(self):
+        """Drop queued jog commands (called before stop/E-stop sends)."""
+        self._last_jog.clear()
+        with self._tx_lock:
+            self._pending_jogs.clear()
 
     def move_and_wait(self, command, timeout=60):
         """
@@ -169,49 +494,41 @@ class RobotController:
             return False, "Not connected"
 
         try:
-            # Stop background reading temporarily
-            self.reading = False
-            time.sleep(0.05)
-
-            # Clear any pending data
-            self.serial.reset_input_buffer()
-
-            # Send command
-            cmd = command if command.endswith('\n') else command + '\n'
-            self.serial.write(cmd.encode())
-            self.serial.flush()
-
-            # Save original timeout and set new one
-            original_timeout = self.serial.timeout
-            self.serial.timeout = timeout
-
-            # Wait for response (blocks until move complete)
-            response = self.serial.readline().decode('utf-8', errors='ignore').strip()
-
-            # Restore original timeout
-            self.serial.timeout = original_timeout
-
-            # Restart background reading
-            self.reading = True
-            if self.read_thread is None or not self.read_thread.is_alive():
-                self.read_thread = threading.Thread(target=self._read_loop, daemon=True)
-                self.read_thread.start()
-
-            if not response:
+            # Drop stale acks from earlier commands; the background
+            # reader keeps running and posts the fresh ack to the queue
+            while True:
+                try:
+                    self._resp_q.get_nowait()
+                except queue.Empty:
+                    break
+
+            # Send command through the writer queue (keeps ordering
+            # with any previously queued commands)
+            self._waiting = True
+            self.send(command)
+
+            # Block until the reader delivers the move-complete ack;
+            # decode only this one line (the hot path stays bytes)
+            try:
+                response = self._resp_q.get(timeout=timeout)
+            except queue.Empty:
                 return False, "Timeout"
-            elif response.startswith('E'):
+            finally:
+                self._waiting = False
+            response = response.decode('utf-8', errors='ignore')
+
+            if response.startswith('E'):
                 return False, response
             else:
-                self.last_response = response
                 return True, response
 
         except Exception as e:
-            self.reading = True
             return False, str(e)
 
     def stop_jog(self):
         """Stop all jogging motion."""
         self.jogging = False
+        self._clear_pending_jogs()
         return self.send("S")
 
     def jog_joint(self, joint, direction, speed=25, accel=10, decel=10):
@@ -227,7 +544,9 @@ class RobotController:
         # Code: J1- = 10, J1+ = 11, J2- = 20, J2+ = 21, etc.
         code = joint * 10 + (1 if direction > 0 else 0)
         self.jogging = True
-        return self.send(f"LJ{code}S{robot_speed}A{accel}D{decel}")
+        return self.send_jog(
+            ('J', joint),
+            _jog_command(b'LJ', code, robot_speed, accel, decel, self._jog_cache))
 
     def jog_cartesian(self, axis, direction, speed=25, accel=10, decel=10):
         """
@@ -243,7 +562,9 @@ class RobotController:
             return False
         code = axis_map[axis] * 10 + (1 if direction > 0 else 0)
         self.jogging = True
-        return self.send(f"LC{code}S{robot_speed}A{accel}D{decel}")
+        return self.send_jog(
+            ('C', axis),
+            _jog_command(b'LC', code, robot_speed, accel, decel, self._jog_cache))
 
     def jog_j7(self, direction, speed=25, accel=10, decel=10):
         """Jog linear track (J7)."""
@@ -251,11 +572,14 @@ class RobotController:
         robot_speed = max(1, int(speed * 25 / 100))
         code = 70 + (1 if direction > 0 else 0)
         self.jogging = True
-        return self.send(f"LJ{code}S{robot_speed}A{accel}D{decel}")
+        return self.send_jog(
+            ('J', 7),
+            _jog_command(b'LJ', code, robot_speed, accel, decel, self._jog_cache))
 
     def emergency_stop(self):
         """Emergency stop."""
         self.jogging = False
+        self._clear_pending_jogs()
         return self.send("ES")
 
     def get_position(self):
@@ -5,11 +5,47 @@ Xbox Controller Interface
 Cross-platform Xbox controller support for Linux (inputs library) and Windows (XInput).
 """
 
+import glob
+import os
+import select
+import struct
 import sys
 import time
 import threading
 import ctypes
 
+# Raw Linux input_event layout: struct timeval + type, code, value
+_EVDEV_FMT = 'llHHi'
+_EVDEV_SIZE = struct.calcsize(_EVDEV_FMT)
+
+# Event types we care about
+_EV_KEY = 0x01
+_EV_ABS = 0x03
+
+# ABS axis codes
+_ABS_X, _ABS_Y, _ABS_Z = 0x00, 0x01, 0x02
+_ABS_RX, _ABS_RY, _ABS_RZ = 0x03, 0x04, 0x05
+_ABS_HAT0X, _ABS_HAT0Y = 0x10, 0x11
+
+# Whole XINPUT_STATE (dwPacketNumber + XINPUT_GAMEPAD) decoded in one
+# C-level call instead of seven ctypes descriptor reads per poll
+_XINPUT_STATE_UNPACK = struct.Struct('<IHBBhhhh').unpack_from
+
+
+def _normalize_stick(val, deadzone=8000):
+    """Normalize a raw XInput thumbstick value to -1.0..1.0."""
+    if -deadzone < val < deadzone:
+        return 0.0
+    return max(-1.0, min(1.0, val / 32767.0))
+
+
+# Normalized value for every possible 16-bit stick sample, indexed by
+# the raw value's unsigned representation (val & 0xFFFF). A tuple lookup
+# reuses the same float objects instead of recomputing per sample.
+_STICK_LUT = tuple(
+    _normalize_stick(v - 65536 if v >= 32768 else v) for v in range(65536)
+)
+
 
 class XboxController:
     """Cross-platform Xbox controller interface."""
@@ -28,11 +64,16 @@ class XboxController:
     DPAD_LEFT = 'DPAD_LEFT'
     DPAD_RIGHT = 'DPAD_RIGHT'
 
-    def __init__(self):
+    def __init__(self, poll_interval=0.008):
         self.connected = False
+        # Base poll interval for the Windows XInput loop; Linux reads
+        # block in select() on the evdev fd, so no interval applies there
+        self.poll_interval = poll_interval
         self.platform = sys.platform
         self._xinput = None
         self._controller_idx = None
+        self._evdev_fd = None  # raw /dev/input fd (Linux fast path)
+        self._hat_state = {}   # per-axis D-pad value, keyed by neg button
 
         # Current state
         self.buttons = set()
@@ -111,7 +152,15 @@ class XboxController:
             return False
 
     def _connect_linux(self):
-        """Connect using inputs library on Linux."""
+        """Connect on Linux: direct evdev first, inputs library fallback."""
+        # Fast path: read /dev/input/eventN directly (no per-event
+        # Python-level translation inside the inputs library)
+        fd = self._open_evdev()
+        if fd is not None:
+            self._evdev_fd = fd
+            self.connected = True
+            return True
+
         try:
             from inputs import devices
             if devices.gamepads:
@@ -124,6 +173,16 @@ class XboxController:
         except Exception:
             return False
 
+    def _open_evdev(self):
+        """Open the gamepad's raw event device, or None if unavailable."""
+        candidates = sorted(glob.glob('/dev/input/by-id/*-event-joystick'))
+        for path in candidates:
+            try:
+                return os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+            except OSError:
+                continue
+        return None
+
     def start_polling(self):
         """Start background polling thread."""
         if not self.connected:
@@ -141,161 +200,334 @@ class XboxController:
         """Main polling loop."""
         if self.platform == 'win32':
             self._poll_windows()
+        elif self._evdev_fd is not None:
+            self._poll_evdev()
         else:
             self._poll_linux()
 
     def _poll_windows(self):
         """Windows XInput polling."""
-        # Button masks
-        BTN_MASKS = {
-            0x1000: self.BTN_A,
-            0x2000: self.BTN_B,
-            0x4000: self.BTN_X,
-            0x8000: self.BTN_Y,
-            0x0100: self.BTN_LB,
-            0x0200: self.BTN_RB,
-            0x0020: self.BTN_BACK,
-            0x0010: self.BTN_START,
-            0x0001: self.DPAD_UP,
-            0x0002: self.DPAD_DOWN,
-            0x0004: self.DPAD_LEFT,
-            0x0008: self.DPAD_RIGHT,
-        }
+        # Hoist everything the ~120Hz loop touches into locals: attribute
+        # lookups on self/ctypes are a real cost at this rate.
+        get_state = self._xinput.XInputGetState
+        idx = self._controller_idx
+        state = self._XINPUT_STATE()
+        p_state = ctypes.byref(state)
+        sleep = time.sleep
+        unpack_state = _XINPUT_STATE_UNPACK
+        button_bits = _XINPUT_BUTTON_BITS
+
+        # Button state as a raw 16-bit mask; press/release are branchless
+        # XOR/AND diffs instead of per-poll set construction.
+        btn_bits = 0
+        last_pkt = -1
+        probe_count = 0
+
+        # Adaptive poll interval: poll_interval (8 ms default) while the
+        # pad is active, ramping to 4x after ~30 idle ticks
+        # (dwPacketNumber unchanged); any activity snaps straight back
+        base_delay = self.poll_interval
+        max_delay = base_delay * 4
+        delay = base_delay
+        idle_ticks = 0
 
         while self._polling:
-            state = self._XINPUT_STATE()
-            if self._xinput.XInputGetState(self._controller_idx, ctypes.byref(state)) != 0:
+            if get_state(idx, p_state) != 0:
+                # XInputGetState on a disconnected pad internally scans
+                # USB and is expensive - back off to 1 Hz on the same
+                # slot, rescanning all four slots every other probe
                 self.connected = False
-                time.sleep(0.5)
-                continue
-
-            gp = state.Gamepad
-
-            # Parse buttons
-            new_buttons = set()
-            for mask, name in BTN_MASKS.items():
-                if gp.wButtons & mask:
-                    new_buttons.add(name)
-
-            # Detect presses and releases
-            pressed = new_buttons - self.prev_buttons
-            released = self.prev_buttons - new_buttons
-
-            for btn in pressed:
-                if self.on_button_press:
-                    self.on_button_press(btn)
-
-            for btn in released:
-                if self.on_button_release:
-                    self.on_button_release(btn)
-
-            self.prev_buttons = self.buttons
-            self.buttons = new_buttons
+                probe_count += 1
+                if probe_count % 2 == 0:
+                    for slot in range(4):
+                        if get_state(slot, p_state) == 0:
+                            idx = self._controller_idx = slot
+                            break
+                    else:
+                        sleep(1.0)
+                        continue
+                else:
+                    sleep(1.0)
+                    continue
 
-            # Parse sticks (normalize to -1.0 to 1.0)
-            def normalize(val, deadzone=8000):
-                if abs(val) < deadzone:
-                    return 0.0
-                return max(-1.0, min(1.0, val / 32767.0))
+            if not self.connected:
+                self.connected = True
+                probe_count = 0
+
+            # Decode the whole state in one struct call
+            pkt, wb, raw_lt, raw_rt, lx, ly, rx, ry = unpack_state(state)
+
+            # XInput bumps dwPacketNumber only when the controller state
+            # changes - skip all processing while it is idle
+            if pkt == last_pkt:
+                idle_ticks += 1
+                if idle_ticks > 30:
+                    delay = min(max_delay, delay * 1.25)
+                sleep(delay)
+                continue
+            last_pkt = pkt
+            idle_ticks = 0
+            delay = base_delay
+
+            # Diff buttons via bitmask; the public set view is updated
+            # incrementally (only for buttons that actually changed)
+            new_bits = wb
+            changed = new_bits ^ btn_bits
+            if changed:
+                pressed = changed & new_bits
+                released = changed & btn_bits
+                self.prev_buttons = set(self.buttons)
+                for mask, name in button_bits:
+                    if pressed & mask:
+                        self.buttons.add(name)
+                        if self.on_button_press:
+                            self.on_button_press(name)
+                    elif released & mask:
+                        self.buttons.discard(name)
+                        if self.on_button_release:
+                            self.on_button_release(name)
+                btn_bits = new_bits
+
+            # Parse sticks via the precomputed normalization table;
+            # only notify when the normalized values actually changed
+            lut = _STICK_LUT
+            ls = (lut[lx & 0xFFFF], lut[ly & 0xFFFF])
+            rs = (lut[rx & 0xFFFF], lut[ry & 0xFFFF])
+            if ls != self.left_stick or rs != self.right_stick:
+                self.left_stick = ls
+                self.right_stick = rs
+                if self.on_stick_move:
+                    self.on_stick_move(ls, rs)
 
-            self.left_stick = (normalize(gp.sThumbLX), normalize(gp.sThumbLY))
-            self.right_stick = (normalize(gp.sThumbRX), normalize(gp.sThumbRY))
+            # Parse triggers (0-255 to 0.0-1.0)
+            lt = raw_lt / 255.0
+            rt = raw_rt / 255.0
+            if lt != self.left_trigger or rt != self.right_trigger:
+                self.left_trigger = lt
+                self.right_trigger = rt
+                if self.on_trigger:
+                    self.on_trigger(lt, rt)
 
-            if self.on_stick_move:
-                self.on_stick_move(self.left_stick, self.right_stick)
+            sleep(base_delay)  # ~120Hz at the default interval
 
-            # Parse triggers (0-255 to 0.0-1.0)
-            self.left_trigger = gp.bLeftTrigger / 255.0
-            self.right_trigger = gp.bRightTrigger / 255.0
+    def _poll_evdev(self):
+        """Linux raw evdev polling (blocks in select until events arrive)."""
+        fd = self._evdev_fd
+        unpack_from = struct.unpack_from
 
-            if self.on_trigger:
-                self.on_trigger(self.left_trigger, self.right_trigger)
+        while self._polling:
+            try:
+                ready, _, _ = select.select([fd], [], [], 0.5)
+            except OSError:
+                break
+            if not ready:
+                continue
 
-            time.sleep(0.008)  # ~120Hz
+            try:
+                data = os.read(fd, _EVDEV_SIZE * 64)
+            except BlockingIOError:
+                continue
+            except OSError:
+                self.connected = False
+                break
+
+            for off in range(0, len(data) - _EVDEV_SIZE + 1, _EVDEV_SIZE):
+                _, _, etype, code, value = unpack_from(_EVDEV_FMT, data, off)
+
+                if etype == _EV_KEY:
+                    btn = _EVDEV_BUTTON_CODES.get(code)
+                    if btn is None:
+                        continue
+                    if value == 1:
+                        self.buttons.add(btn)
+                        if self.on_button_press:
+                            self.on_button_press(btn)
+                    elif value == 0:
+                        self.buttons.discard(btn)
+                        if self.on_button_release:
+                            self.on_button_release(btn)
+
+                elif etype == _EV_ABS:
+                    prev_ls = self.left_stick
+                    prev_rs = self.right_stick
+                    prev_lt = self.left_trigger
+                    prev_rt = self.right_trigger
+
+                    if code == _ABS_X:
+                        self.left_stick = (value / 32767.0, self.left_stick[1])
+                    elif code == _ABS_Y:
+                        self.left_stick = (self.left_stick[0], -value / 32767.0)
+                    elif code == _ABS_RX:
+                        self.right_stick = (value / 32767.0, self.right_stick[1])
+                    elif code == _ABS_RY:
+                        self.right_stick = (self.right_stick[0], -value / 32767.0)
+                    elif code == _ABS_Z:
+                        self.left_trigger = min(1.0, value / 1023.0)
+                    elif code == _ABS_RZ:
+                        self.right_trigger = min(1.0, value / 1023.0)
+                    elif code == _ABS_HAT0X:
+                        self._handle_hat(self.DPAD_LEFT, self.DPAD_RIGHT, value)
+                    elif code == _ABS_HAT0Y:
+                        self._handle_hat(self.DPAD_UP, self.DPAD_DOWN, value)
+
+                    if self.on_stick_move and (
+                            self.left_stick != prev_ls
+                            or self.right_stick != prev_rs):
+                        self.on_stick_move(self.left_stick, self.right_stick)
+                    if self.on_trigger and (
+                            self.left_trigger != prev_lt
+                            or self.right_trigger != prev_rt):
+                        self.on_trigger(self.left_trigger, self.right_trigger)
+
+    def _handle_hat(self, neg_btn, pos_btn, value):
+        """Diff a D-pad hat axis (-1/0/1) against its tracked state.
+
+        Only the transition touches the button set and callbacks, so a
+        centered hat costs one dict lookup - and releases now fire when
+        the pad returns to 0 (the old discard-always version never
+        reported them).
+        """
+        prev = self._hat_state.get(neg_btn, 0)
+        if value == prev:
+            return
+        self._hat_state[neg_btn] = value
+        if prev:
+            old = neg_btn if prev == -1 else pos_btn
+            self.buttons.discard(old)
+            if self.on_button_release:
+                self.on_button_release(old)
+        if value:
+            new = neg_btn if value == -1 else pos_btn
+            self.buttons.add(new)
+            if self.on_button_press:
+                self.on_button_press(new)
 
     def _poll_linux(self):
-        """Linux inputs library polling."""
+        """Linux inputs library polling (fallback when evdev is closed)."""
         try:
             from inputs import get_gamepad
 
-            # Event code mappings
-            BTN_MAP = {
-                'BTN_SOUTH': self.BTN_A,
-                'BTN_EAST': self.BTN_B,
-                'BTN_WEST': self.BTN_X,
-                'BTN_NORTH': self.BTN_Y,
-                'BTN_TL': self.BTN_LB,
-                'BTN_TR': self.BTN_RB,
-                'BTN_SELECT': self.BTN_BACK,
-                'BTN_START': self.BTN_START,
-            }
+            handlers = self._build_inputs_handlers()
 
             while self._polling:
                 try:
                     events = get_gamepad()
+
+                    prev_ls = self.left_stick
+                    prev_rs = self.right_stick
+                    prev_lt = self.left_trigger
+                    prev_rt = self.right_trigger
+
+                    # O(1) hash dispatch per event instead of an
+                    # if/elif code-compare ladder
                     for event in events:
-                        # Buttons
-                        if event.code in BTN_MAP:
-                            btn = BTN_MAP[event.code]
-                            if event.state == 1:
-                                self.buttons.add(btn)
-                                if self.on_button_press:
-                                    self.on_button_press(btn)
-                            else:
-                                self.buttons.discard(btn)
-                                if self.on_button_release:
-                                    self.on_button_release(btn)
-
-                        # D-pad
-                        elif event.code == 'ABS_HAT0X':
-                            self.buttons.discard(self.DPAD_LEFT)
-                            self.buttons.discard(self.DPAD_RIGHT)
-                            if event.state == -1:
-                                self.buttons.add(self.DPAD_LEFT)
-                                if self.on_button_press:
-                                    self.on_button_press(self.DPAD_LEFT)
-                            elif event.state == 1:
-                                self.buttons.add(self.DPAD_RIGHT)
-                                if self.on_button_press:
-                                    self.on_button_press(self.DPAD_RIGHT)
-
-                        elif event.code == 'ABS_HAT0Y':
-                            self.buttons.discard(self.DPAD_UP)
-                            self.buttons.discard(self.DPAD_DOWN)
-                            if event.state == -1:
-                                self.buttons.add(self.DPAD_UP)
-                                if self.on_button_press:
-                                    self.on_button_press(self.DPAD_UP)
-                            elif event.state == 1:
-                                self.buttons.add(self.DPAD_DOWN)
-                                if self.on_button_press:
-                                    self.on_button_press(self.DPAD_DOWN)
-
-                        # Left stick
-                        elif event.code == 'ABS_X':
-                            self.left_stick = (event.state / 32767.0, self.left_stick[1])
-                        elif event.code == 'ABS_Y':
-                            self.left_stick = (self.left_stick[0], -event.state / 32767.0)
-
-                        # Right stick
-                        elif event.code == 'ABS_RX':
-                            self.right_stick = (event.state / 32767.0, self.right_stick[1])
-                        elif event.code == 'ABS_RY':
-                            self.right_stick = (self.right_stick[0], -event.state / 32767.0)
-
-                        # Triggers (Xbox Series uses 0-1023, older uses 0-255)
-                        elif event.code == 'ABS_Z':
-                            self.left_trigger = min(1.0, event.state / 1023.0)
-                        elif event.code == 'ABS_RZ':
-                            self.right_trigger = min(1.0, event.state / 1023.0)
-
-                        if self.on_stick_move:
-                            self.on_stick_move(self.left_stick, self.right_stick)
-                        if self.on_trigger:
-                            self.on_trigger(self.left_trigger, self.right_trigger)
+                        h = handlers.get(event.code)
+                        if h is not None:
+                            h(event.state)
+
+                    # One coalesced notification per event batch
+                    if self.on_stick_move and (
+                            self.left_stick != prev_ls
+                            or self.right_stick != prev_rs):
+                        self.on_stick_move(self.left_stick, self.right_stick)
+                    if self.on_trigger and (
+                            self.left_trigger != prev_lt
+                            or self.right_trigger != prev_rt):
+                        self.on_trigger(self.left_trigger, self.right_trigger)
 
                 except Exception as e:
                     time.sleep(0.1)
 
         except Exception as e:
             print(f"Linux gamepad error: {e}")
+
+    def _build_inputs_handlers(self):
+        """Build the event-code -> handler dispatch table once."""
+
+        def key_handler(btn):
+            def handle(state):
+                if state == 1:
+                    self.buttons.add(btn)
+                    if self.on_button_press:
+                        self.on_button_press(btn)
+                else:
+                    self.buttons.discard(btn)
+                    if self.on_button_release:
+                        self.on_button_release(btn)
+            return handle
+
+        def abs_x(v):
+            self.left_stick = (v / 32767.0, self.left_stick[1])
+
+        def abs_y(v):
+            self.left_stick = (self.left_stick[0], -v / 32767.0)
+
+        def abs_rx(v):
+            self.right_stick = (v / 32767.0, self.right_stick[1])
+
+        def abs_ry(v):
+            self.right_stick = (self.right_stick[0], -v / 32767.0)
+
+        # Triggers (Xbox Series uses 0-1023, older uses 0-255)
+        def abs_z(v):
+            self.left_trigger = min(1.0, v / 1023.0)
+
+        def abs_rz(v):
+            self.right_trigger = min(1.0, v / 1023.0)
+
+        def hat_x(v):
+            self._handle_hat(self.DPAD_LEFT, self.DPAD_RIGHT, v)
+
+        def hat_y(v):
+            self._handle_hat(self.DPAD_UP, self.DPAD_DOWN, v)
+
+        handlers = {
+            'BTN_SOUTH': key_handler(self.BTN_A),
+            'BTN_EAST': key_handler(self.BTN_B),
+            'BTN_WEST': key_handler(self.BTN_X),
+            'BTN_NORTH': key_handler(self.BTN_Y),
+            'BTN_TL': key_handler(self.BTN_LB),
+            'BTN_TR': key_handler(self.BTN_RB),
+            'BTN_SELECT': key_handler(self.BTN_BACK),
+            'BTN_START': key_handler(self.BTN_START),
+            'ABS_X': abs_x,
+            'ABS_Y': abs_y,
+            'ABS_RX': abs_rx,
+            'ABS_RY': abs_ry,
+            'ABS_Z': abs_z,
+            'ABS_RZ': abs_rz,
+            'ABS_HAT0X': hat_x,
+            'ABS_HAT0Y': hat_y,
+        }
+        return handlers
+
+
+# XInput wButtons bit masks mapped to button names (precomputed once;
+# used by the _poll_windows hot loop)
+_XINPUT_BUTTON_BITS = (
+    (0x1000, XboxController.BTN_A),
+    (0x2000, XboxController.BTN_B),
+    (0x4000, XboxController.BTN_X),
+    (0x8000, XboxController.BTN_Y),
+    (0x0100, XboxController.BTN_LB),
+    (0x0200, XboxController.BTN_RB),
+    (0x0020, XboxController.BTN_BACK),
+    (0x0010, XboxController.BTN_START),
+    (0x0001, XboxController.DPAD_UP),
+    (0x0002, XboxController.DPAD_DOWN),
+    (0x0004, XboxController.DPAD_LEFT),
+    (0x0008, XboxController.DPAD_RIGHT),
+)
+
+# Raw evdev key codes mapped to button names (mirrors the inputs-library
+# BTN_* mapping used by _poll_linux: BTN_WEST=X, BTN_NORTH=Y on xpad)
+_EVDEV_BUTTON_CODES = {
+    0x130: XboxController.BTN_A,      # BTN_SOUTH
+    0x131: XboxController.BTN_B,      # BTN_EAST
+    0x134: XboxController.BTN_X,      # BTN_WEST
+    0x133: XboxController.BTN_Y,      # BTN_NORTH
+    0x136: XboxController.BTN_LB,     # BTN_TL
+    0x137: XboxController.BTN_RB,     # BTN_TR
+    0x13a: XboxController.BTN_BACK,   # BTN_SELECT
+    0x13b: XboxController.BTN_START,  # BTN_START
+}
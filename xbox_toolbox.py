@@ -36,14 +36,12 @@ import os
 import time
 import threading
 import json
-import re
-import serial
-import serial.tools.list_ports
+import queue
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
 
 # Import modular components
-from FRL_robot_controller import RobotController
+from FRL_robot_controller import RobotController, cached_comports
 from FRL_xbox_controller import XboxController
 
 # Import from shared location
@@ -67,6 +65,100 @@ DEFAULT_SPEED = 25
 DEFAULT_ACCEL = 10
 DEFAULT_DECEL = 10
 
+# Theme palettes (module-level constants: built once at import, shared
+# by every toolbox instance)
+THEME_COLORS = {
+    # ttkbootstrap cyborg theme - black with vibrant multi-color accents
+    'cyborg': {
+        'bg_dark': '#060606',
+        'bg_mid': '#1a1a1a',
+        'bg_light': '#2d2d2d',
+        'accent': '#ff3366',    # hot pink for title
+        'accent2': '#00ffcc',   # cyan/teal
+        'accent3': '#bf5fff',   # purple/violet
+        'accent4': '#ffff00',   # yellow
+        'success': '#39ff14',   # neon green
+        'warning': '#ff8800',   # orange
+        'danger': '#ff2222',    # red for E-STOP
+        'robot1': '#00aaff',    # blue for robot 1
+        'robot2': '#ff66aa',    # pink for robot 2
+        'feeder': '#ffcc00',    # gold for feeder
+        'text': '#ffffff',
+        'text_dim': '#888888',
+        'border': '#404040'
+    },
+    # ttkbootstrap darkly theme colors
+    'darkly': {
+        'bg_dark': '#222222',
+        'bg_mid': '#303030',
+        'bg_light': '#444444',
+        'accent': '#375a7f',    # darkly primary
+        'accent2': '#00bc8c',   # darkly success
+        'success': '#00bc8c',
+        'warning': '#f39c12',
+        'text': '#ffffff',
+        'text_dim': '#adb5bd',
+        'border': '#444444'
+    },
+    # ttkbootstrap superhero - dark blue/orange
+    'superhero': {
+        'bg_dark': '#2b3e50',
+        'bg_mid': '#3a5068',
+        'bg_light': '#4e6680',
+        'accent': '#df691a',    # superhero primary (orange)
+        'accent2': '#5cb85c',   # superhero success
+        'success': '#5cb85c',
+        'warning': '#f0ad4e',
+        'text': '#ffffff',
+        'text_dim': '#8a9dae',
+        'border': '#4e6680'
+    },
+    # ttkbootstrap vapor - purple/pink
+    'vapor': {
+        'bg_dark': '#1a1a2e',
+        'bg_mid': '#2d2d44',
+        'bg_light': '#3f3f5a',
+        'accent': '#ea39b8',    # vapor primary (pink)
+        'accent2': '#3cf281',   # vapor success (neon green)
+        'success': '#3cf281',
+        'warning': '#ffe700',
+        'text': '#ffffff',
+        'text_dim': '#8a8aa3',
+        'border': '#3f3f5a'
+    },
+    # ttkbootstrap solar - dark blue/yellow
+    'solar': {
+        'bg_dark': '#002b36',
+        'bg_mid': '#073642',
+        'bg_light': '#094959',
+        'accent': '#b58900',    # solar primary (yellow)
+        'accent2': '#2aa198',   # solar success (cyan)
+        'success': '#2aa198',
+        'warning': '#cb4b16',
+        'text': '#ffffff',
+        'text_dim': '#839496',
+        'border': '#094959'
+    },
+    # Custom cyber theme (default) - black background with colorful accents
+    'cyber': {
+        'bg_dark': '#0a0a0a',
+        'bg_mid': '#1a1a1a',
+        'bg_light': '#2a2a2a',
+        'accent': '#ff3366',       # hot pink
+        'accent2': '#00ffcc',      # cyan
+        'accent3': '#bf5fff',      # purple
+        'success': '#39ff14',      # neon green
+        'warning': '#ff8800',      # orange
+        'danger': '#cc0000',       # red
+        'robot1': '#00aaff',       # blue
+        'robot2': '#ff66aa',       # pink
+        'feeder': '#ffcc00',       # gold
+        'text': '#ffffff',
+        'text_dim': '#888899',
+        'border': '#333333'
+    },
+}
+
 
 # =============================================================================
 # MAIN TOOLBOX APPLICATION
@@ -90,12 +182,41 @@ class XboxToolbox:
     OP_TRAIN = 1
     OP_NAMES = ["Move", "Train"]
 
+    # Stick-to-axis tables, indexed by argmax over (lx, ly, rx, ry)
+    _JOG_JOINT_AXES = (1, 2, 3, 4)
+    _JOG_CART_AXES = ('Y', 'X', 'Rz', 'Z')
+
+    # D-pad direction tables: direction -> full jog spec, built once at
+    # class creation so dispatch reuses the same tuples.  Joint mode maps
+    # the pad to J5/J6, cartesian mode to Rx/Ry.
+    _DPAD_JOINT = {
+        'up': ('J', 5, -1), 'down': ('J', 5, +1),
+        'left': ('J', 6, -1), 'right': ('J', 6, +1),
+    }
+    _DPAD_CART = {
+        'up': ('C', 'Rx', +1), 'down': ('C', 'Rx', -1),
+        'left': ('C', 'Ry', -1), 'right': ('C', 'Ry', +1),
+    }
+
+    # Buttons whose release stops the current jog (O(1) membership)
+    _RELEASE_BUTTONS = frozenset((
+        XboxController.BTN_X, XboxController.BTN_Y,
+        XboxController.BTN_LB, XboxController.BTN_RB,
+        XboxController.DPAD_UP, XboxController.DPAD_DOWN,
+        XboxController.DPAD_LEFT, XboxController.DPAD_RIGHT))
+
     # Config file for saving window geometry
     CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.xbox_toolbox_config.json')
 
     # Pathway storage directory
     PATHWAY_DIR = os.path.expanduser('~/.xbox_toolbox_pathways')
 
+    # Log widget keeps only this many newest lines
+    LOG_MAX_LINES = 200
+
+    # One-shot guard for the process-global ttk style registry
+    _styles_configured = False
+
     def __init__(self, root):
         self.root = root
         # Set title based on theme (so user can tell which version)
@@ -132,20 +253,70 @@ class XboxToolbox:
         # Feeder has independent speed control (mm/sec)
         self.feeder_speed = 10  # Default 10 mm/sec
 
+        # Window visibility (redraws are skipped while minimized)
+        self._visible = True
+
+        # Stick-value readout in the action label (toggled with Ctrl+D)
+        self._debug_overlay = False
+
+        # Last drawn state per LED canvas (dirty check for _set_led)
+        self._led_state = {}
+        # Last (text, fg) per status label (dirty check for _set_label),
+        # plus the widgets whose update was deferred while minimized
+        self._label_cache = {}
+        self._stale_labels = {}
+
+        # Stick event coalescing state (all gates use time.monotonic,
+        # which is immune to NTP/DST wall-clock jumps)
+        self._last_stick = (0.0, 0.0, 0.0, 0.0)
+        self._last_stick_dispatch = 0.0
+        self._last_jog_send = 0.0
+        self._trigger_cooldown = 0.0
+
+        # Pending debounced config-save timer id
+        self._save_after = None
+
+        # Log lines awaiting a batched Text insert
+        self._log_pending = []
+        self._log_flush_scheduled = False
+
+        # Persistent bar-canvas items (created on first draw)
+        self._speed_bar_id = None
+        self._last_drawn_speed = None
+        self._smooth_bar_id = None
+        self._last_drawn_smooth = None
+
         # Ensure pathway directory exists
         os.makedirs(self.PATHWAY_DIR, exist_ok=True)
 
         # Build GUI
         self._build_gui()
 
-        # Bind Xbox callbacks
-        self.xbox.on_button_press = self._on_button_press
-        self.xbox.on_button_release = self._on_button_release
-        self.xbox.on_stick_move = self._on_stick_move
-        self.xbox.on_trigger = self._on_trigger
-
-        # Start status update loop
+        # Bind Xbox callbacks: the polling thread only enqueues; events
+        # are drained and handled on the Tk thread (Tk isn't thread-safe
+        # and handlers touch widgets)
+        self._btn_handlers = self._build_button_handlers()
+
+        # (device, LED canvases) pairs for the status loop, built once so
+        # the 200 ms tick just iterates instead of naming every widget
+        self._led_groups = (
+            (self.xbox, (self.xbox_led,)),
+            (self.robot1, (self.r1_led, self.r1_status_led)),
+            (self.robot2, (self.r2_led, self.r2_status_led)),
+            (self.feeder, (self.feeder_led, self.feeder_status_led)),
+        )
+
+        self._event_q = queue.Queue()
+        put = self._event_q.put
+        self.xbox.on_button_press = lambda b: put(('press', b))
+        self.xbox.on_button_release = lambda b: put(('release', b))
+        self.xbox.on_stick_move = lambda ls, rs: put(('stick', ls, rs))
+        self.xbox.on_trigger = lambda lt, rt: put(('trigger', lt, rt))
+
+        # Start event drain + status update + jog keepalive loops
+        self._process_xbox_events()
         self._update_status()
+        self._jog_keepalive()
 
     def _load_config(self):
         """Load saved configuration from config file."""
@@ -173,191 +344,83 @@ class XboxToolbox:
             self._config['speed'] = self.speed
             self._config['smoothness'] = self.smoothness
             self._config['feeder_speed'] = self.feeder_speed
-            with open(self.CONFIG_FILE, 'w') as f:
+            # Write-then-rename so a crash mid-write can't truncate the
+            # config; os.replace is atomic on the same filesystem
+            tmp_file = self.CONFIG_FILE + '.tmp'
+            with open(tmp_file, 'w') as f:
                 json.dump(self._config, f, indent=2)
+            os.replace(tmp_file, self.CONFIG_FILE)
         except Exception:
             pass
 
+    def _get_config_value(self, key, default=None):
+        """Read a setting from the in-memory config (loaded once at start)."""
+        return self._config.get(key, default)
+
     def _apply_saved_ports(self):
         """Apply saved port selections after GUI is built."""
-        if hasattr(self, '_config'):
-            # Restore port selections if they exist in available ports
-            ports = [p.device for p in serial.tools.list_ports.comports()]
-
-            saved_r1 = self._config.get('robot1_port', '')
-            if saved_r1 and saved_r1 in ports:
-                self.r1_port_var.set(saved_r1)
-
-            saved_r2 = self._config.get('robot2_port', '')
-            if saved_r2 and saved_r2 in ports:
-                self.r2_port_var.set(saved_r2)
-
-            saved_feeder = self._config.get('feeder_port', '')
-            if saved_feeder and saved_feeder in ports:
-                self.feeder_port_var.set(saved_feeder)
-
-            # Restore speed
-            saved_speed = self._config.get('speed', DEFAULT_SPEED)
-            self.speed = saved_speed
-            self.speed_var.set(saved_speed)
-            self.speed_label.config(text=f"{saved_speed}%")
-            self._draw_speed_bar()
+        # Restore port selections if they exist in available ports
+        # (reuses the scan _refresh_ports just did)
+        ports = [p.device for p in cached_comports(ttl=2.0)]
 
-            # Restore smoothness
-            saved_smooth = self._config.get('smoothness', 50)
-            self.smoothness = saved_smooth
-            self.smooth_var.set(saved_smooth)
-            self.smooth_label.config(text=f"{saved_smooth}%")
-            self._draw_smooth_bar()
+        saved_r1 = self._get_config_value('robot1_port', '')
+        if saved_r1 and saved_r1 in ports:
+            self.r1_port_var.set(saved_r1)
+
+        saved_r2 = self._get_config_value('robot2_port', '')
+        if saved_r2 and saved_r2 in ports:
+            self.r2_port_var.set(saved_r2)
 
-            # Restore feeder speed
-            saved_feeder_speed = self._config.get('feeder_speed', 10)
-            self.feeder_speed = saved_feeder_speed
-            self.feeder_speed_var.set(saved_feeder_speed)
-            self.feeder_speed_label.config(text=f"{saved_feeder_speed} mm/s")
+        saved_feeder = self._get_config_value('feeder_port', '')
+        if saved_feeder and saved_feeder in ports:
+            self.feeder_port_var.set(saved_feeder)
+
+        # Restore speed/smoothness/feeder speed; the var traces mirror
+        # each value into its label and bar
+        self.speed = self._get_config_value('speed', DEFAULT_SPEED)
+        self.speed_var.set(self.speed)
+
+        self.smoothness = self._get_config_value('smoothness', 50)
+        self.smooth_var.set(self.smoothness)
+
+        self.feeder_speed = self._get_config_value('feeder_speed', 10)
+        self.feeder_speed_var.set(self.feeder_speed)
 
     def _load_geometry(self):
         """Load saved window geometry from config file (legacy wrapper)."""
         self._load_config()
 
-    def _save_geometry(self):
-        """Save current window geometry to config file (legacy wrapper)."""
+    def _save_geometry(self, event=None):
+        """Debounced config save: write once after changes settle.
+
+        Bound to <Configure>, so a window drag/resize fires dozens of
+        events - only the last one (after 500 ms of quiet) hits disk.
+        """
+        if event is not None and event.widget is not self.root:
+            return
+        if self._save_after is not None:
+            self.root.after_cancel(self._save_after)
+        self._save_after = self.root.after(500, self._do_save_config)
+
+    def _do_save_config(self):
+        """Trailing edge of the debounce: perform the actual write."""
+        self._save_after = None
         self._save_config()
 
     def _build_gui(self):
         """Build the Tkinter GUI with theme support."""
-        # Detect theme mode
+        # Detect theme mode and pick its (shared, module-level) palette
         self.theme_mode = getattr(self.root, '_theme_mode', 'cyber')
-
-        # === THEME COLORS ===
-        if self.theme_mode == 'cyborg':
-            # ttkbootstrap cyborg theme - black with vibrant multi-color accents
-            self.colors = {
-                'bg_dark': '#060606',
-                'bg_mid': '#1a1a1a',
-                'bg_light': '#2d2d2d',
-                'accent': '#ff3366',    # hot pink for title
-                'accent2': '#00ffcc',   # cyan/teal
-                'accent3': '#bf5fff',   # purple/violet
-                'accent4': '#ffff00',   # yellow
-                'success': '#39ff14',   # neon green
-                'warning': '#ff8800',   # orange
-                'danger': '#ff2222',    # red for E-STOP
-                'robot1': '#00aaff',    # blue for robot 1
-                'robot2': '#ff66aa',    # pink for robot 2
-                'feeder': '#ffcc00',    # gold for feeder
-                'text': '#ffffff',
-                'text_dim': '#888888',
-                'border': '#404040'
-            }
-        elif self.theme_mode == 'darkly':
-            # ttkbootstrap darkly theme colors
-            self.colors = {
-                'bg_dark': '#222222',
-                'bg_mid': '#303030',
-                'bg_light': '#444444',
-                'accent': '#375a7f',    # darkly primary
-                'accent2': '#00bc8c',   # darkly success
-                'success': '#00bc8c',
-                'warning': '#f39c12',
-                'text': '#ffffff',
-                'text_dim': '#adb5bd',
-                'border': '#444444'
-            }
-        elif self.theme_mode == 'superhero':
-            # ttkbootstrap superhero - dark blue/orange
-            self.colors = {
-                'bg_dark': '#2b3e50',
-                'bg_mid': '#3a5068',
-                'bg_light': '#4e6680',
-                'accent': '#df691a',    # superhero primary (orange)
-                'accent2': '#5cb85c',   # superhero success
-                'success': '#5cb85c',
-                'warning': '#f0ad4e',
-                'text': '#ffffff',
-                'text_dim': '#8a9dae',
-                'border': '#4e6680'
-            }
-        elif self.theme_mode == 'vapor':
-            # ttkbootstrap vapor - purple/pink
-            self.colors = {
-                'bg_dark': '#1a1a2e',
-                'bg_mid': '#2d2d44',
-                'bg_light': '#3f3f5a',
-                'accent': '#ea39b8',    # vapor primary (pink)
-                'accent2': '#3cf281',   # vapor success (neon green)
-                'success': '#3cf281',
-                'warning': '#ffe700',
-                'text': '#ffffff',
-                'text_dim': '#8a8aa3',
-                'border': '#3f3f5a'
-            }
-        elif self.theme_mode == 'solar':
-            # ttkbootstrap solar - dark blue/yellow
-            self.colors = {
-                'bg_dark': '#002b36',
-                'bg_mid': '#073642',
-                'bg_light': '#094959',
-                'accent': '#b58900',    # solar primary (yellow)
-                'accent2': '#2aa198',   # solar success (cyan)
-                'success': '#2aa198',
-                'warning': '#cb4b16',
-                'text': '#ffffff',
-                'text_dim': '#839496',
-                'border': '#094959'
-            }
-        else:
-            # Custom cyber theme (default) - black background with colorful accents
-            self.colors = {
-                'bg_dark': '#0a0a0a',
-                'bg_mid': '#1a1a1a',
-                'bg_light': '#2a2a2a',
-                'accent': '#ff3366',       # hot pink
-                'accent2': '#00ffcc',      # cyan
-                'accent3': '#bf5fff',      # purple
-                'success': '#39ff14',      # neon green
-                'warning': '#ff8800',      # orange
-                'danger': '#cc0000',       # red
-                'robot1': '#00aaff',       # blue
-                'robot2': '#ff66aa',       # pink
-                'feeder': '#ffcc00',       # gold
-                'text': '#ffffff',
-                'text_dim': '#888899',
-                'border': '#333333'
-            }
+        self.colors = THEME_COLORS.get(self.theme_mode, THEME_COLORS['cyber'])
 
         # Configure root window
         self.root.configure(bg=self.colors['bg_dark'])
 
-        # Style configuration
-        style = ttk.Style()
-        if self.theme_mode != 'darkly':
-            style.theme_use('clam')
-
-        # Configure dark theme styles
-        style.configure("Dark.TFrame", background=self.colors['bg_dark'])
-        style.configure("Dark.TLabelframe", background=self.colors['bg_dark'],
-                       foreground=self.colors['accent2'], bordercolor=self.colors['border'])
-        style.configure("Dark.TLabelframe.Label", background=self.colors['bg_dark'],
-                       foreground=self.colors['accent2'], font=("Consolas", 10, "bold"))
-        style.configure("Dark.TLabel", background=self.colors['bg_dark'],
-                       foreground=self.colors['text'], font=("Consolas", 10))
-        style.configure("Title.TLabel", background=self.colors['bg_dark'],
-                       foreground=self.colors['accent'], font=("Consolas", 20, "bold"))
-        style.configure("Mode.TLabel", background=self.colors['bg_mid'],
-                       foreground=self.colors['accent2'], font=("Consolas", 16, "bold"))
-        style.configure("Action.TLabel", background=self.colors['bg_dark'],
-                       foreground=self.colors['success'], font=("Consolas", 12, "bold"))
-        style.configure("Dark.TButton", background=self.colors['bg_light'],
-                       foreground=self.colors['text'], font=("Consolas", 9, "bold"),
-                       bordercolor=self.colors['accent2'], padding=5)
-        style.map("Dark.TButton",
-                 background=[('active', self.colors['accent2']), ('pressed', self.colors['accent'])],
-                 foreground=[('active', self.colors['bg_dark'])])
-        style.configure("Dark.TCombobox", fieldbackground=self.colors['bg_mid'],
-                       background=self.colors['bg_light'], foreground=self.colors['text'])
-        style.configure("Dark.Horizontal.TScale", background=self.colors['bg_dark'],
-                       troughcolor=self.colors['bg_mid'])
+        # Style configuration (the ttk style registry is process-global,
+        # so run it once even if the toolbox is instantiated repeatedly)
+        if not XboxToolbox._styles_configured:
+            self._configure_styles()
+            XboxToolbox._styles_configured = True
 
         # Main frame
         main_frame = ttk.Frame(self.root, style="Dark.TFrame", padding="15")
@@ -516,7 +579,8 @@ class XboxToolbox:
         self.r1_port_combo = r1_panel['combo']
         self.r1_status_led = r1_panel['led']
         r1_panel['button'].configure(command=self._connect_robot1)
-        r1_panel['refresh'].configure(command=self._refresh_ports)
+        r1_panel['refresh'].configure(
+            command=lambda: self._refresh_ports(force=True))
 
         # Robot 2 (pink)
         r2_color = self.colors.get('robot2', self.colors['accent2'])
@@ -685,47 +749,115 @@ class XboxToolbox:
                             command=self._connect_xbox)
         xbox_btn.pack(fill=tk.X, pady=5)
 
+        # Mirror each control variable into its label/bar declaratively;
+        # callers then just set the var instead of updating three widgets
+        self.speed_var.trace_add('write', self._refresh_speed_ui)
+        self.smooth_var.trace_add('write', self._refresh_smooth_ui)
+        self.feeder_speed_var.trace_add('write', self._refresh_feeder_speed_ui)
+
         # Populate ports and restore saved selections
         self._refresh_ports()
         self._apply_saved_ports()
 
+        # Persist geometry (debounced) as the window is moved/resized
+        self.root.bind('<Configure>', self._save_geometry)
+
+        # Track visibility so redraws pause while minimized
+        self.root.bind('<Unmap>', self._on_unmap)
+        self.root.bind('<Map>', self._on_map)
+
+        # Ctrl+D toggles the stick debug readout
+        self.root.bind('<Control-d>', self._toggle_debug_overlay)
+
         # Auto-connect to FRL devices on startup
         self.root.after(500, self._auto_connect_frl)
 
+    def _configure_styles(self):
+        """Register the ttk styles for the active theme (run once)."""
+        style = ttk.Style()
+        if self.theme_mode != 'darkly':
+            style.theme_use('clam')
+
+        # Configure dark theme styles
+        style.configure("Dark.TFrame", background=self.colors['bg_dark'])
+        style.configure("Dark.TLabelframe", background=self.colors['bg_dark'],
+                       foreground=self.colors['accent2'], bordercolor=self.colors['border'])
+        style.configure("Dark.TLabelframe.Label", background=self.colors['bg_dark'],
+                       foreground=self.colors['accent2'], font=("Consolas", 10, "bold"))
+        style.configure("Dark.TLabel", background=self.colors['bg_dark'],
+                       foreground=self.colors['text'], font=("Consolas", 10))
+        style.configure("Title.TLabel", background=self.colors['bg_dark'],
+                       foreground=self.colors['accent'], font=("Consolas", 20, "bold"))
+        style.configure("Mode.TLabel", background=self.colors['bg_mid'],
+                       foreground=self.colors['accent2'], font=("Consolas", 16, "bold"))
+        style.configure("Action.TLabel", background=self.colors['bg_dark'],
+                       foreground=self.colors['success'], font=("Consolas", 12, "bold"))
+        style.configure("Dark.TButton", background=self.colors['bg_light'],
+                       foreground=self.colors['text'], font=("Consolas", 9, "bold"),
+                       bordercolor=self.colors['accent2'], padding=5)
+        style.map("Dark.TButton",
+                 background=[('active', self.colors['accent2']), ('pressed', self.colors['accent'])],
+                 foreground=[('active', self.colors['bg_dark'])])
+        style.configure("Dark.TCombobox", fieldbackground=self.colors['bg_mid'],
+                       background=self.colors['bg_light'], foreground=self.colors['text'])
+        style.configure("Dark.Horizontal.TScale", background=self.colors['bg_dark'],
+                       troughcolor=self.colors['bg_mid'])
+
     def _auto_connect_frl(self):
-        """Auto-connect to FRL udev symlinks and Xbox controller on startup."""
+        """Auto-connect to FRL udev symlinks and Xbox controller on startup.
+
+        Each serial open can block for hundreds of ms, so the connects
+        run on worker threads (total stall = slowest device, not the
+        sum) and post their results back to the Tk thread.  The cheap
+        symlink checks and combo updates stay here.
+        """
         connected = []
 
-        # Xbox controller
+        # Xbox controller - local device open, fast
         if self.xbox.connect():
             self.xbox.start_polling()
             connected.append("Xbox")
 
-        # Robot 1
+        attempts = []
         if os.path.exists(FRL_ROBOT1_PORT):
             self.r1_port_var.set(FRL_ROBOT1_PORT)
             self.robot1.port = FRL_ROBOT1_PORT
-            if self.robot1.connect():
-                connected.append("Robot 1")
+            attempts.append((self.robot1, "Robot 1"))
 
-        # Robot 2
         if os.path.exists(FRL_ROBOT2_PORT):
             self.r2_port_var.set(FRL_ROBOT2_PORT)
             self.robot2.port = FRL_ROBOT2_PORT
-            if self.robot2.connect():
-                connected.append("Robot 2")
+            attempts.append((self.robot2, "Robot 2"))
 
-        # Feeder
         if os.path.exists(FRL_FEEDER_PORT):
             self.feeder_port_var.set(FRL_FEEDER_PORT)
             self.feeder.port = FRL_FEEDER_PORT
-            if self.feeder.connect():
-                connected.append("Feeder")
+            attempts.append((self.feeder, "Feeder"))
+
+        results = {}
+
+        def finish(name, ok):
+            # Tk thread: record and log once everything reported in
+            results[name] = ok
+            if len(results) == len(attempts):
+                connected.extend(n for _, n in attempts if results[n])
+                if connected:
+                    self._log(f"Auto-connected: {', '.join(connected)}")
+                else:
+                    self._log("No devices found - connect manually")
+
+        if not attempts:
+            if connected:
+                self._log(f"Auto-connected: {', '.join(connected)}")
+            else:
+                self._log("No devices found - connect manually")
+            return
 
-        if connected:
-            self._log(f"Auto-connected: {', '.join(connected)}")
-        else:
-            self._log("No devices found - connect manually")
+        for device, name in attempts:
+            threading.Thread(
+                target=lambda d=device, n=name: self.root.after(
+                    0, finish, n, d.connect()),
+                daemon=True).start()
 
     def _create_led_indicator(self, parent, label, col):
         """Create an LED-style status indicator."""
@@ -733,7 +865,7 @@ class XboxToolbox:
         frame.pack(side=tk.LEFT, padx=20, pady=10)
 
         led = tk.Canvas(frame, width=12, height=12, bg=self.colors['bg_mid'], highlightthickness=0)
-        led.create_oval(2, 2, 10, 10, fill='#333344', outline=self.colors['border'])
+        led.create_oval(2, 2, 10, 10, fill='#333344', outline=self.colors['border'], tags='led')
         led.pack(side=tk.LEFT, padx=5)
 
         tk.Label(frame, text=label, font=("Consolas", 9, "bold"),
@@ -764,7 +896,7 @@ class XboxToolbox:
         title_frame.pack(fill=tk.X)
 
         led = tk.Canvas(title_frame, width=10, height=10, bg=self.colors['bg_light'], highlightthickness=0)
-        led.create_oval(1, 1, 9, 9, fill='#333344', outline='#444455')
+        led.create_oval(1, 1, 9, 9, fill='#333344', outline='#444455', tags='led')
         led.pack(side=tk.LEFT, padx=(0, 5))
 
         tk.Label(title_frame, text=title, font=("Consolas", 10, "bold"),
@@ -793,39 +925,65 @@ class XboxToolbox:
                 'button': connect_btn, 'refresh': refresh_btn}
 
     def _draw_speed_bar(self):
-        """Draw the speed bar visualization."""
-        self.speed_canvas.delete("all")
+        """Draw the speed bar visualization.
+
+        The background/fill rectangles are created once and then only
+        resized/recolored, and repeated calls at the same speed (e.g.
+        trigger polls below the change threshold) skip Tk entirely.
+        """
+        if not self._visible:
+            return
         speed = self.speed_var.get()
+        if speed == self._last_drawn_speed:
+            return
+        self._last_drawn_speed = speed
         width = int(290 * speed / 100)
+        color = self.colors['success'] if speed < 70 else (self.colors['warning'] if speed < 90 else self.colors['accent'])
 
-        # Background
-        self.speed_canvas.create_rectangle(5, 5, 295, 20, fill=self.colors['bg_dark'], outline='')
-
-        # Gradient effect (multiple rectangles)
-        if speed > 0:
-            color = self.colors['success'] if speed < 70 else (self.colors['warning'] if speed < 90 else self.colors['accent'])
-            self.speed_canvas.create_rectangle(5, 5, 5 + width, 20, fill=color, outline='')
+        if self._speed_bar_id is None:
+            self.speed_canvas.create_rectangle(5, 5, 295, 20, fill=self.colors['bg_dark'], outline='')
+            self._speed_bar_id = self.speed_canvas.create_rectangle(
+                5, 5, 5 + width, 20, fill=color, outline='')
+        else:
+            self.speed_canvas.coords(self._speed_bar_id, 5, 5, 5 + width, 20)
+            self.speed_canvas.itemconfig(self._speed_bar_id, fill=color)
 
     def _draw_smooth_bar(self):
-        """Draw the smoothness bar visualization."""
-        self.smooth_canvas.delete("all")
+        """Draw the smoothness bar visualization (same scheme as speed)."""
+        if not self._visible:
+            return
         smooth = self.smooth_var.get()
+        if smooth == self._last_drawn_smooth:
+            return
+        self._last_drawn_smooth = smooth
         width = int(290 * smooth / 100)
 
-        # Background
-        self.smooth_canvas.create_rectangle(5, 5, 295, 20, fill=self.colors['bg_dark'], outline='')
+        if self._smooth_bar_id is None:
+            self.smooth_canvas.create_rectangle(5, 5, 295, 20, fill=self.colors['bg_dark'], outline='')
+            self._smooth_bar_id = self.smooth_canvas.create_rectangle(
+                5, 5, 5 + width, 20, fill=self.colors['accent2'], outline='')
+        else:
+            self.smooth_canvas.coords(self._smooth_bar_id, 5, 5, 5 + width, 20)
 
-        # Bar color based on smoothness level
-        if smooth > 0:
-            color = self.colors['accent2']
-            self.smooth_canvas.create_rectangle(5, 5, 5 + width, 20, fill=color, outline='')
+    def _refresh_speed_ui(self, *_):
+        """Trace callback: mirror speed_var into its label and bar."""
+        self._set_label(self.speed_label, 'speed', f"{self.speed_var.get()}%")
+        self._draw_speed_bar()
+
+    def _refresh_smooth_ui(self, *_):
+        """Trace callback: mirror smooth_var into its label and bar."""
+        self._set_label(self.smooth_label, 'smooth', f"{self.smooth_var.get()}%")
+        self._draw_smooth_bar()
+
+    def _refresh_feeder_speed_ui(self, *_):
+        """Trace callback: mirror feeder_speed_var into its label."""
+        self._set_label(self.feeder_speed_label, 'feeder_speed',
+                        f"{self.feeder_speed_var.get()} mm/s")
 
     def _set_smoothness(self, value):
         """Set smoothness value (1-100)."""
         self.smoothness = max(1, min(100, value))
         self.smooth_var.set(self.smoothness)
-        self.smooth_label.config(text=f"{self.smoothness}%")
-        self._draw_smooth_bar()
 
     def _get_accel_decel(self):
         """Convert smoothness to accel/decel values for robot (1-25 range)."""
@@ -836,45 +994,140 @@ class XboxToolbox:
         accel = max(1, int(26 - (self.smoothness * 25 / 100)))
         return accel, accel  # Same value for accel and decel
 
+    def _toggle_debug_overlay(self, event=None):
+        """Toggle the per-tick stick value readout (bound to Ctrl+D)."""
+        self._debug_overlay = not self._debug_overlay
+        self._log(f"Stick debug overlay {'on' if self._debug_overlay else 'off'}")
+
+    def _on_unmap(self, event):
+        """Pause visual updates while the window is minimized."""
+        if event.widget is self.root:
+            self._visible = False
+
+    def _on_map(self, event):
+        """Resume visual updates and repaint anything that went stale."""
+        if event.widget is self.root and not self._visible:
+            self._visible = True
+            # Invalidate the dirty-check caches so the next status tick
+            # and bar draws reflect state that changed while hidden
+            self._led_state.clear()
+            self._last_drawn_speed = None
+            self._last_drawn_smooth = None
+            self._draw_speed_bar()
+            self._draw_smooth_bar()
+            # Replay label updates that were deferred while hidden (the
+            # cache kept the newest state; the widgets never saw it)
+            for key, widget in self._stale_labels.items():
+                text, fg = self._label_cache[key]
+                if fg is None:
+                    widget.config(text=text)
+                else:
+                    widget.config(text=text, fg=fg)
+            self._stale_labels.clear()
+
+    def _set_label(self, widget, key, text, fg=None):
+        """Reconfigure a status label only when its text/color change.
+
+        Repeated identical updates (stick held, trigger polls) would
+        otherwise trigger a Tk relayout per call.  While the window is
+        minimized the new state is still cached, and the widget work is
+        deferred to _on_map so nothing shows stale text afterwards.
+        """
+        if self._label_cache.get(key) == (text, fg):
+            return
+        self._label_cache[key] = (text, fg)
+        if not self._visible:
+            self._stale_labels[key] = widget
+            return
+        if fg is None:
+            widget.config(text=text)
+        else:
+            widget.config(text=text, fg=fg)
+
+    def _set_action(self, text, fg=None):
+        """Memoized update of the current-action label."""
+        self._set_label(self.action_label, 'action', text, fg)
+
     def _set_led(self, led_canvas, connected):
-        """Set LED indicator state."""
-        led_canvas.delete("all")
+        """Set LED indicator state (no-op unless the state changed)."""
+        if self._led_state.get(led_canvas) == connected:
+            return
+        self._led_state[led_canvas] = connected
         color = self.colors['success'] if connected else '#333344'
         glow = self.colors['success'] if connected else self.colors['border']
-        led_canvas.create_oval(2, 2, 10, 10, fill=color, outline=glow)
+        # Recolor the persistent oval instead of delete()+create_oval()
+        led_canvas.itemconfig('led', fill=color, outline=glow)
 
     def _log(self, message):
-        """Add message to log."""
-        self.log_text.configure(state=tk.NORMAL)
+        """Add message to log (bounded to the newest 200 lines).
+
+        Without the trim the Text widget grows forever over a long
+        session, making every insert/see progressively slower.
+        """
         timestamp = time.strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
-        self.log_text.configure(state=tk.DISABLED)
+        # Buffer and flush on a short timer so a burst of messages costs
+        # one Text insert instead of one per line
+        self._log_pending.append(f"[{timestamp}] {message}\n")
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after(100, self._flush_log)
+
+    def _flush_log(self):
+        """Insert all buffered log lines into the Text widget at once."""
+        self._log_flush_scheduled = False
+        pending = self._log_pending
+        if not pending:
+            return
+        self._log_pending = []
+        text = self.log_text
+        text.configure(state=tk.NORMAL)
+        text.insert(tk.END, ''.join(pending))
+        lines = int(text.index('end-1c').split('.')[0])
+        if lines > self.LOG_MAX_LINES:
+            text.delete('1.0', f'{lines - self.LOG_MAX_LINES + 1}.0')
+        text.see(tk.END)
+        text.configure(state=tk.DISABLED)
+
+    def _refresh_ports(self, force=False):
+        """Refresh available serial ports without blocking the Tk thread.
+
+        Enumeration can take hundreds of ms with flaky USB devices, so
+        it runs on a worker thread and posts the result back via
+        after() - the standard Tk marshalling pattern.  force=True
+        bypasses the scan cache (the explicit Refresh button uses it,
+        since someone clicking it just plugged something in).
+        """
+        threading.Thread(target=self._refresh_ports_worker, args=(force,),
+                         daemon=True).start()
 
-    def _refresh_ports(self):
-        """Refresh available serial ports, prioritizing FRL udev symlinks."""
-        # Get standard ports
-        ports = [p.device for p in serial.tools.list_ports.comports()]
+    def _refresh_ports_worker(self, force=False):
+        """Worker-thread half of the refresh: enumerate, then marshal."""
+        # TTL-cached: startup and programmatic refreshes reuse the last
+        # scan; an explicit click forces a fresh one
+        ports = [p.device for p in cached_comports(ttl=0.0 if force else 2.0)]
 
         # Check for FRL udev symlinks and add them to the front
-        frl_ports = []
-        for frl_port in [FRL_ROBOT1_PORT, FRL_ROBOT2_PORT, FRL_FEEDER_PORT]:
-            if os.path.exists(frl_port):
-                frl_ports.append(frl_port)
+        frl_ports = [p for p in (FRL_ROBOT1_PORT, FRL_ROBOT2_PORT, FRL_FEEDER_PORT)
+                     if os.path.exists(p)]
 
         # Combine: FRL symlinks first, then standard ports
         all_ports = frl_ports + [p for p in ports if p not in frl_ports]
+        self.root.after(0, self._apply_ports, all_ports, frl_ports)
 
+    def _apply_ports(self, all_ports, frl_ports):
+        """Tk-thread half of the refresh: update combos and selections."""
         self.r1_port_combo['values'] = all_ports
         self.r2_port_combo['values'] = all_ports
         self.feeder_port_combo['values'] = all_ports
 
-        # Auto-select FRL symlinks if they exist
-        if os.path.exists(FRL_ROBOT1_PORT):
+        # Auto-select FRL symlinks where nothing is chosen yet (don't
+        # clobber a saved or user-picked port - this now runs after
+        # _apply_saved_ports because of the thread hop)
+        if FRL_ROBOT1_PORT in frl_ports and not self.r1_port_var.get():
             self.r1_port_var.set(FRL_ROBOT1_PORT)
-        if os.path.exists(FRL_ROBOT2_PORT):
+        if FRL_ROBOT2_PORT in frl_ports and not self.r2_port_var.get():
             self.r2_port_var.set(FRL_ROBOT2_PORT)
-        if os.path.exists(FRL_FEEDER_PORT):
+        if FRL_FEEDER_PORT in frl_ports and not self.feeder_port_var.get():
             self.feeder_port_var.set(FRL_FEEDER_PORT)
 
     def _connect_xbox(self):
@@ -931,14 +1184,11 @@ class XboxToolbox:
         """Handle speed slider change."""
         self.speed = int(float(val))
         self.speed_var.set(self.speed)
-        self.speed_label.config(text=f"{self.speed}%")
-        self._draw_speed_bar()
 
     def _set_feeder_speed(self, speed):
         """Set the feeder speed."""
         self.feeder_speed = max(1, min(100, speed))
         self.feeder_speed_var.set(self.feeder_speed)
-        self.feeder_speed_label.config(text=f"{self.feeder_speed} mm/s")
         self._log(f"Feeder speed: {self.feeder_speed} mm/s")
 
     def _increase_feeder_speed(self):
@@ -952,14 +1202,19 @@ class XboxToolbox:
     def _emergency_stop_all(self):
         """Emergency stop all devices."""
         self._log("!!! EMERGENCY STOP ALL !!!")
-        self.action_label.config(text="EMERGENCY STOP", foreground="red")
+        self._set_action("EMERGENCY STOP", "red")
 
+        # Robot e-stops are non-blocking queue pushes, so firing them
+        # back-to-back already reaches both arms within microseconds
         if self.robot1.connected:
             self.robot1.emergency_stop()
         if self.robot2.connected:
             self.robot2.emergency_stop()
         if self.feeder.connected:
-            self.feeder.stop()
+            # feeder.stop() writes to the Arduino synchronously; run it
+            # off-thread so a sluggish USB port can't delay the rest of
+            # the stop handling
+            threading.Thread(target=self.feeder.stop, daemon=True).start()
 
         self.current_jog = None
 
@@ -972,7 +1227,7 @@ class XboxToolbox:
             self.colors.get('robot2', self.colors['accent2']),
             self.colors.get('accent3', self.colors['accent2'])  # purple for both
         ]
-        self.mode_label.config(text=mode_icons[self.device_mode], fg=mode_colors[self.device_mode])
+        self._set_label(self.mode_label, 'mode', mode_icons[self.device_mode], mode_colors[self.device_mode])
         self._log(f"Switched to: {self.MODE_NAMES[self.device_mode]}")
 
         # Stop any current jogging when switching
@@ -982,7 +1237,7 @@ class XboxToolbox:
         """Set movement mode (joint or cartesian)."""
         self.move_mode = mode
         mode_name = "[ JOINT MODE ]" if mode == self.MOVE_JOINT else "[ CARTESIAN MODE ]"
-        self.movement_mode_label.config(text=mode_name)
+        self._set_label(self.movement_mode_label, 'movement_mode', mode_name)
         self._log(f"Movement mode: {'Joint' if mode == self.MOVE_JOINT else 'Cartesian'}")
 
     def _stop_all_jog(self):
@@ -994,74 +1249,58 @@ class XboxToolbox:
         if self.feeder.connected:
             self.feeder.stop()
         self.current_jog = None
-        self.action_label.config(text="IDLE", fg=self.colors['text'])
+        self._set_action("IDLE", self.colors['text'])
+
+    def _press_start(self):
+        """Start button: playback toggle in Train mode, E-stop in Move."""
+        if self.operation_mode == self.OP_TRAIN:
+            self._toggle_playback()
+        else:
+            self._emergency_stop_all()
+
+    def _press_a(self):
+        """A button: add waypoint in Train mode, joint mode in Move."""
+        if self.operation_mode == self.OP_TRAIN:
+            self._capture_waypoint()
+        else:
+            self._set_move_mode(self.MOVE_JOINT)
+
+    def _press_b(self):
+        """B button: delete waypoint in Train mode, cartesian in Move."""
+        if self.operation_mode == self.OP_TRAIN:
+            self._delete_last_waypoint()
+        else:
+            self._set_move_mode(self.MOVE_CARTESIAN)
+
+    def _build_button_handlers(self):
+        """Build the press-dispatch table once (O(1) lookup per press)."""
+        return {
+            XboxController.BTN_BACK: self._cycle_device_mode,
+            XboxController.BTN_START: self._press_start,
+            XboxController.BTN_A: self._press_a,
+            XboxController.BTN_B: self._press_b,
+            # J7 linear track / J9 tube feeder - always available
+            XboxController.BTN_X: lambda: self._jog_j7(-1),
+            XboxController.BTN_Y: lambda: self._jog_j7(+1),
+            XboxController.BTN_LB: lambda: self._jog_j9(-1),
+            XboxController.BTN_RB: lambda: self._jog_j9(+1),
+            # D-pad - always available for positioning
+            XboxController.DPAD_UP: lambda: self._jog_dpad('up'),
+            XboxController.DPAD_DOWN: lambda: self._jog_dpad('down'),
+            XboxController.DPAD_LEFT: lambda: self._jog_dpad('left'),
+            XboxController.DPAD_RIGHT: lambda: self._jog_dpad('right'),
+        }
 
     def _on_button_press(self, button):
         """Handle Xbox button press."""
-        # Back = cycle device (always available)
-        if button == XboxController.BTN_BACK:
-            self._cycle_device_mode()
-
-        # Start behavior depends on mode
-        elif button == XboxController.BTN_START:
-            if self.operation_mode == self.OP_TRAIN:
-                # In Train mode: toggle playback
-                self._toggle_playback()
-            else:
-                # In Move mode: emergency stop
-                self._emergency_stop_all()
-
-        # A button behavior depends on mode
-        elif button == XboxController.BTN_A:
-            if self.operation_mode == self.OP_TRAIN:
-                # In Train mode: add waypoint
-                self._capture_waypoint()
-            else:
-                # In Move mode: switch to joint mode
-                self._set_move_mode(self.MOVE_JOINT)
-
-        # B button behavior depends on mode
-        elif button == XboxController.BTN_B:
-            if self.operation_mode == self.OP_TRAIN:
-                # In Train mode: delete last waypoint
-                self._delete_last_waypoint()
-            else:
-                # In Move mode: switch to cartesian mode
-                self._set_move_mode(self.MOVE_CARTESIAN)
-
-        # X = J7 negative (linear track) - always available for positioning
-        elif button == XboxController.BTN_X:
-            self._jog_j7(-1)
-
-        # Y = J7 positive (linear track) - always available for positioning
-        elif button == XboxController.BTN_Y:
-            self._jog_j7(+1)
-
-        # LB = J9 retract (tube feeder reverse) - always available
-        elif button == XboxController.BTN_LB:
-            self._jog_j9(-1)
-
-        # RB = J9 feed (tube feeder forward) - always available
-        elif button == XboxController.BTN_RB:
-            self._jog_j9(+1)
-
-        # D-pad - always available for positioning
-        elif button == XboxController.DPAD_UP:
-            self._jog_dpad('up')
-        elif button == XboxController.DPAD_DOWN:
-            self._jog_dpad('down')
-        elif button == XboxController.DPAD_LEFT:
-            self._jog_dpad('left')
-        elif button == XboxController.DPAD_RIGHT:
-            self._jog_dpad('right')
+        handler = self._btn_handlers.get(button)
+        if handler is not None:
+            handler()
 
     def _on_button_release(self, button):
         """Handle Xbox button release."""
         # Stop jogging when X/Y (J9), bumpers (J7), or d-pad released
-        if button in [XboxController.BTN_X, XboxController.BTN_Y,
-                      XboxController.BTN_LB, XboxController.BTN_RB,
-                      XboxController.DPAD_UP, XboxController.DPAD_DOWN,
-                      XboxController.DPAD_LEFT, XboxController.DPAD_RIGHT]:
+        if button in self._RELEASE_BUTTONS:
             self._stop_all_jog()
 
     def _on_stick_move(self, left_stick, right_stick):
@@ -1069,18 +1308,34 @@ class XboxToolbox:
         lx, ly = left_stick
         rx, ry = right_stick
 
+        # Bind the hottest lookups as locals - this runs per poll tick
+        _abs = abs
+
+        # Coalesce the high-rate event stream: ignore jitter below a
+        # small epsilon since the last dispatched sample, and cap
+        # dispatch at ~120 Hz so Tk and the serial link aren't flooded
+        last = self._last_stick
+        if (_abs(lx - last[0]) < 0.02 and _abs(ly - last[1]) < 0.02 and
+                _abs(rx - last[2]) < 0.02 and _abs(ry - last[3]) < 0.02):
+            return
+        now_mono = time.monotonic()
+        if now_mono - self._last_stick_dispatch < 0.008:
+            return
+        self._last_stick = (lx, ly, rx, ry)
+        self._last_stick_dispatch = now_mono
+
         # Apply deadzone
         dz = 0.25  # Increased deadzone for better control
-        if abs(lx) < dz: lx = 0
-        if abs(ly) < dz: ly = 0
-        if abs(rx) < dz: rx = 0
-        if abs(ry) < dz: ry = 0
+        if _abs(lx) < dz: lx = 0
+        if _abs(ly) < dz: ly = 0
+        if _abs(rx) < dz: rx = 0
+        if _abs(ry) < dz: ry = 0
 
-        # Determine what to jog based on stick position
-        new_jog = None
-
-        # Prioritize the strongest input
-        max_val = max(abs(lx), abs(ly), abs(rx), abs(ry))
+        # Prioritize the strongest input via a single argmax over the
+        # four magnitudes; ties keep the old lx > ly > rx > ry priority
+        vals = (lx, ly, rx, ry)
+        mags = (_abs(lx), _abs(ly), _abs(rx), _abs(ry))
+        max_val = max(mags)
 
         if max_val < dz:
             # No significant input - ALWAYS stop jogging for safety
@@ -1088,80 +1343,78 @@ class XboxToolbox:
                 self._stop_all_jog()
             return
 
-        # Update action display to show stick input (for debugging)
-        self.action_label.config(text=f"Stick: L({lx:.1f},{ly:.1f}) R({rx:.1f},{ry:.1f})",
-                                 fg=self.colors['accent2'])
+        # Stick value readout (Ctrl+D): four float formats per tick are
+        # pure overhead when nobody is watching, so off by default
+        if self._debug_overlay:
+            self._set_action(f"Stick: L({lx:.1f},{ly:.1f}) R({rx:.1f},{ry:.1f})",
+                             self.colors['accent2'])
 
+        idx = mags.index(max_val)
         if self.move_mode == self.MOVE_JOINT:
             # Joint mode: L=J1/J2, R=J3/J4
-            if abs(lx) >= abs(ly) and abs(lx) >= abs(rx) and abs(lx) >= abs(ry):
-                new_jog = ('J', 1, 1 if lx > 0 else -1)
-            elif abs(ly) >= abs(lx) and abs(ly) >= abs(rx) and abs(ly) >= abs(ry):
-                new_jog = ('J', 2, 1 if ly > 0 else -1)
-            elif abs(rx) >= abs(lx) and abs(rx) >= abs(ly) and abs(rx) >= abs(ry):
-                new_jog = ('J', 3, 1 if rx > 0 else -1)
-            elif abs(ry) >= abs(lx) and abs(ry) >= abs(ly) and abs(ry) >= abs(rx):
-                new_jog = ('J', 4, 1 if ry > 0 else -1)
+            new_jog = ('J', self._JOG_JOINT_AXES[idx], 1 if vals[idx] > 0 else -1)
         else:
             # Cartesian mode: L=X/Y, R=Z/Rz
-            if abs(lx) >= abs(ly) and abs(lx) >= abs(rx) and abs(lx) >= abs(ry):
-                new_jog = ('C', 'Y', 1 if lx > 0 else -1)
-            elif abs(ly) >= abs(lx) and abs(ly) >= abs(rx) and abs(ly) >= abs(ry):
-                new_jog = ('C', 'X', 1 if ly > 0 else -1)
-            elif abs(rx) >= abs(lx) and abs(rx) >= abs(ly) and abs(rx) >= abs(ry):
-                new_jog = ('C', 'Rz', 1 if rx > 0 else -1)
-            elif abs(ry) >= abs(lx) and abs(ry) >= abs(ly) and abs(ry) >= abs(rx):
-                new_jog = ('C', 'Z', 1 if ry > 0 else -1)
-
-        # Start new jog or resend if direction changed or enough time passed
-        now = time.time()
-        if not hasattr(self, '_last_jog_send'):
-            self._last_jog_send = 0
+            new_jog = ('C', self._JOG_CART_AXES[idx], 1 if vals[idx] > 0 else -1)
 
+        # Start new jog on direction change; the periodic refresh of a
+        # steadily held jog comes from the _jog_keepalive timer, since a
+        # perfectly steady stick generates no further input events
         if new_jog != self.current_jog:
-            # Direction changed - stop and start new jog
             if self.current_jog is not None:
                 self._stop_all_jog()
             if new_jog is not None:
                 self._start_jog(new_jog)
-                self._last_jog_send = now
-        elif new_jog is not None and (now - self._last_jog_send) > 0.5:
-            # Same direction but resend periodically to keep robot moving
-            self._start_jog(new_jog)
-            self._last_jog_send = now
+                self._last_jog_send = now_mono
+
+    def _jog_keepalive(self):
+        """Resend a held stick jog every 0.5 s to keep the robot moving.
+
+        Runs on its own Tk timer rather than inside _on_stick_move: the
+        controller only delivers events when values change, so a stick
+        held perfectly steady would otherwise never regenerate the jog
+        (the send-layer dedup expires at 0.4 s expecting exactly these
+        refreshes).  Scope matches the old in-handler resend - stick
+        axes only, not D-pad/J7/J9 button jogs.
+        """
+        jog = self.current_jog
+        if jog is not None:
+            now = time.monotonic()
+            if now - self._last_jog_send > 0.5:
+                jog_type, axis, _ = jog
+                if ((jog_type == 'J' and axis in self._JOG_JOINT_AXES) or
+                        (jog_type == 'C' and axis in self._JOG_CART_AXES)):
+                    self._start_jog(jog)
+                    self._last_jog_send = now
+        self.root.after(250, self._jog_keepalive)
 
     def _on_trigger(self, left_trigger, right_trigger):
         """Handle trigger input for speed adjustment - increment/decrement with persistence."""
-        # Initialize state
-        if not hasattr(self, '_trigger_cooldown'):
-            self._trigger_cooldown = 0
-
-        now = time.time()
+        now = time.monotonic()
         if now - self._trigger_cooldown < 0.15:  # 150ms between changes
             return
 
+        speed = self.speed
         speed_changed = False
 
         # RT increases speed when pressed past 20%
         if right_trigger > 0.2:
-            new_speed = min(100, self.speed + 5)
-            if new_speed != self.speed:
-                self.speed = new_speed
+            new_speed = min(100, speed + 5)
+            if new_speed != speed:
+                self.speed = speed = new_speed
                 speed_changed = True
                 self._trigger_cooldown = now
 
         # LT decreases speed when pressed past 20%
         if left_trigger > 0.2 and not speed_changed:
-            new_speed = max(1, self.speed - 5)
-            if new_speed != self.speed:
-                self.speed = new_speed
+            new_speed = max(1, speed - 5)
+            if new_speed != speed:
+                self.speed = speed = new_speed
                 speed_changed = True
                 self._trigger_cooldown = now
 
         if speed_changed:
-            self.speed_var.set(self.speed)
-            self.speed_label.config(text=f"{self.speed}%")
-            self._draw_speed_bar()
+            self.speed_var.set(self.speed)  # trace updates label + bar
             # If currently jogging, resend with new speed
             if self.current_jog is not None:
                 self._start_jog(self.current_jog)
@@ -1181,6 +1434,9 @@ class XboxToolbox:
 
         action_text = ""
 
+        # Snapshot once so both robots get the same speed even if a
+        # trigger event lands mid-dispatch
+        speed = self.speed
         accel, decel = self._get_accel_decel()
 
         for robot in robots:
@@ -1189,17 +1445,17 @@ class XboxToolbox:
 
             if jog_type == 'J':
                 # Joint jog
-                robot.jog_joint(axis, direction, self.speed, accel, decel)
+                robot.jog_joint(axis, direction, speed, accel, decel)
                 dir_str = "+" if direction > 0 else "-"
                 action_text = f"Jogging J{axis}{dir_str}"
             elif jog_type == 'C':
                 # Cartesian jog
-                robot.jog_cartesian(axis, direction, self.speed, accel, decel)
+                robot.jog_cartesian(axis, direction, speed, accel, decel)
                 dir_str = "+" if direction > 0 else "-"
                 action_text = f"Jogging {axis}{dir_str}"
 
         if action_text:
-            self.action_label.config(text=action_text, foreground="blue")
+            self._set_action(action_text, "blue")
 
     def _jog_j7(self, direction):
         """Jog J7 (linear track) on selected robot(s)."""
@@ -1211,13 +1467,14 @@ class XboxToolbox:
         elif self.device_mode == self.MODE_BOTH:
             robots = [self.robot1, self.robot2]
 
+        speed = self.speed
         accel, decel = self._get_accel_decel()
         for robot in robots:
             if robot.connected:
-                robot.jog_j7(direction, self.speed, accel, decel)
+                robot.jog_j7(direction, speed, accel, decel)
 
         dir_str = "+" if direction > 0 else "-"
-        self.action_label.config(text=f"Jogging J7{dir_str} (Track)", foreground="blue")
+        self._set_action(f"Jogging J7{dir_str} (Track)", "blue")
         self.current_jog = ('J', 7, direction)
 
     def _jog_j9(self, direction):
@@ -1231,10 +1488,10 @@ class XboxToolbox:
 
         if direction > 0:
             self.feeder.jog_forward()
-            self.action_label.config(text=f"Tube Feed + ({self.feeder_speed}mm/s)", foreground="blue")
+            self._set_action(f"Tube Feed + ({self.feeder_speed}mm/s)", "blue")
         else:
             self.feeder.jog_reverse()
-            self.action_label.config(text=f"Tube Retract - ({self.feeder_speed}mm/s)", foreground="blue")
+            self._set_action(f"Tube Retract - ({self.feeder_speed}mm/s)", "blue")
         self.current_jog = ('J', 9, direction)
 
     def _jog_dpad(self, direction):
@@ -1247,52 +1504,27 @@ class XboxToolbox:
         elif self.device_mode == self.MODE_BOTH:
             robots = [self.robot1, self.robot2]
 
+        # Filter once up front; connection state can't change mid-dispatch
+        robots = [r for r in robots if r.connected]
+
+        speed = self.speed
         accel, decel = self._get_accel_decel()
 
         if self.move_mode == self.MOVE_JOINT:
-            # D-pad = J5/J6
-            if direction == 'up':
-                for r in robots:
-                    if r.connected: r.jog_joint(5, -1, self.speed, accel, decel)
-                self.action_label.config(text="Jogging J5-", foreground="blue")
-                self.current_jog = ('J', 5, -1)
-            elif direction == 'down':
-                for r in robots:
-                    if r.connected: r.jog_joint(5, +1, self.speed, accel, decel)
-                self.action_label.config(text="Jogging J5+", foreground="blue")
-                self.current_jog = ('J', 5, +1)
-            elif direction == 'left':
-                for r in robots:
-                    if r.connected: r.jog_joint(6, -1, self.speed, accel, decel)
-                self.action_label.config(text="Jogging J6-", foreground="blue")
-                self.current_jog = ('J', 6, -1)
-            elif direction == 'right':
-                for r in robots:
-                    if r.connected: r.jog_joint(6, +1, self.speed, accel, decel)
-                self.action_label.config(text="Jogging J6+", foreground="blue")
-                self.current_jog = ('J', 6, +1)
+            jog = self._DPAD_JOINT[direction]
+            _, axis, sign = jog
+            for r in robots:
+                r.jog_joint(axis, sign, speed, accel, decel)
+            label = f"J{axis}"
         else:
-            # Cartesian: D-pad = Rx/Ry
-            if direction == 'up':
-                for r in robots:
-                    if r.connected: r.jog_cartesian('Rx', +1, self.speed, accel, decel)
-                self.action_label.config(text="Jogging Rx+", foreground="blue")
-                self.current_jog = ('C', 'Rx', +1)
-            elif direction == 'down':
-                for r in robots:
-                    if r.connected: r.jog_cartesian('Rx', -1, self.speed, accel, decel)
-                self.action_label.config(text="Jogging Rx-", foreground="blue")
-                self.current_jog = ('C', 'Rx', -1)
-            elif direction == 'left':
-                for r in robots:
-                    if r.connected: r.jog_cartesian('Ry', -1, self.speed, accel, decel)
-                self.action_label.config(text="Jogging Ry-", foreground="blue")
-                self.current_jog = ('C', 'Ry', -1)
-            elif direction == 'right':
-                for r in robots:
-                    if r.connected: r.jog_cartesian('Ry', +1, self.speed, accel, decel)
-                self.action_label.config(text="Jogging Ry+", foreground="blue")
-                self.current_jog = ('C', 'Ry', +1)
+            jog = self._DPAD_CART[direction]
+            _, axis, sign = jog
+            for r in robots:
+                r.jog_cartesian(axis, sign, speed, accel, decel)
+            label = axis
+
+        self._set_action(f"Jogging {label}{'+' if sign > 0 else '-'}", "blue")
+        self.current_jog = jog
 
     # =========================================================================
     # HELP DIALOG
@@ -1514,7 +1746,7 @@ Sticks not responding:
             self._log(f"WP#{count} R2 joints: [{j[0]:.1f},{j[1]:.1f},{j[2]:.1f},{j[3]:.1f},{j[4]:.1f},{j[5]:.1f}]")
             self._log(f"WP#{count} R2 cart: X={c[0]:.1f} Y={c[1]:.1f} Z={c[2]:.1f}")
 
-        self.action_label.config(text=f"Waypoint #{count} added", fg=self.colors['success'])
+        self._set_action(f"Waypoint #{count} added", self.colors['success'])
 
     def _delete_last_waypoint(self):
         """Delete the last waypoint from the pathway."""
@@ -1523,7 +1755,7 @@ Sticks not responding:
             count = len(self.pathway['waypoints'])
             self.waypoint_count_label.config(text=f"Waypoints: {count}")
             self._log(f"Deleted last waypoint (now {count})")
-            self.action_label.config(text=f"Waypoint deleted ({count} left)", fg=self.colors['warning'])
+            self._set_action(f"Waypoint deleted ({count} left)", self.colors['warning'])
         else:
             self._log("No waypoints to delete")
 
@@ -1532,7 +1764,7 @@ Sticks not responding:
         self.pathway['waypoints'] = []
         self.waypoint_count_label.config(text="Waypoints: 0")
         self._log("Pathway cleared")
-        self.action_label.config(text="Pathway cleared", fg=self.colors['text'])
+        self._set_action("Pathway cleared", self.colors['text'])
 
     def _save_pathway(self):
         """Save the current pathway to a file."""
@@ -1557,7 +1789,7 @@ Sticks not responding:
             with open(filepath, 'w') as f:
                 json.dump(self.pathway, f, indent=2)
             self._log(f"Pathway saved: {name} ({len(self.pathway['waypoints'])} waypoints)")
-            self.action_label.config(text=f"Saved: {name}", fg=self.colors['success'])
+            self._set_action(f"Saved: {name}", self.colors['success'])
         except Exception as e:
             self._log(f"Save failed: {e}")
 
@@ -1613,7 +1845,7 @@ Sticks not responding:
             count = len(self.pathway['waypoints'])
             self.waypoint_count_label.config(text=f"Waypoints: {count}")
             self._log(f"Loaded pathway: {name} ({count} waypoints)")
-            self.action_label.config(text=f"Loaded: {name}", fg=self.colors['success'])
+            self._set_action(f"Loaded: {name}", self.colors['success'])
         except Exception as e:
             self._log(f"Load failed: {e}")
 
@@ -1759,29 +1991,84 @@ Sticks not responding:
 
         return success
 
+    def _process_xbox_events(self):
+        """Drain all queued controller events on the Tk thread.
+
+        Stick and trigger samples are coalesced to the newest one per
+        drain and dispatched before the button events (which run in
+        arrival order), so a burst of polls can never backlog the GUI
+        and a stale stick sample can never undo a newer press.
+        """
+        q = self._event_q
+        stick = trigger = None
+        buttons = []
+        while True:
+            try:
+                ev = q.get_nowait()
+            except queue.Empty:
+                break
+            kind = ev[0]
+            if kind == 'stick':
+                stick = ev
+            elif kind == 'trigger':
+                trigger = ev
+            else:
+                buttons.append(ev)
+        # Stick/trigger go first: a coalesced sample may predate a button
+        # press from the same drain, and a stale centered-stick sample
+        # dispatched after the press would _stop_all_jog the jog the
+        # button just started
+        if stick is not None:
+            self._on_stick_move(stick[1], stick[2])
+        if trigger is not None:
+            self._on_trigger(trigger[1], trigger[2])
+        for ev in buttons:
+            if ev[0] == 'press':
+                self._on_button_press(ev[1])
+            else:
+                self._on_button_release(ev[1])
+        self.root.after(15, self._process_xbox_events)
+
     def _update_status(self):
-        """Periodic status update with LED indicators."""
-        # Update LED indicators
-        self._set_led(self.xbox_led, self.xbox.connected)
-        self._set_led(self.r1_led, self.robot1.connected)
-        self._set_led(self.r1_status_led, self.robot1.connected)
-        self._set_led(self.r2_led, self.robot2.connected)
-        self._set_led(self.r2_status_led, self.robot2.connected)
-        self._set_led(self.feeder_led, self.feeder.connected)
-        self._set_led(self.feeder_status_led, self.feeder.connected)
+        """Periodic status update with LED indicators.
+
+        _set_led skips Tk work unless a connection state actually
+        flipped, so each tick is just seven attribute reads when idle -
+        which lets this poll a bit faster than the old 500 ms repaint
+        loop without burning CPU.
+        """
+        if self._visible:
+            set_led = self._set_led
+            for device, leds in self._led_groups:
+                state = device.connected
+                for led in leds:
+                    set_led(led, state)
 
         # Schedule next update
-        self.root.after(500, self._update_status)
+        self.root.after(200, self._update_status)
+
+    def _disconnect_all(self):
+        """Disconnect every device in parallel.
+
+        Each disconnect flushes its serial port and joins its worker
+        threads, so doing them back-to-back stacks three waits; running
+        them concurrently makes shutdown as slow as the slowest device
+        rather than the sum.
+        """
+        workers = [threading.Thread(target=dev.disconnect, daemon=True)
+                   for dev in (self.robot1, self.robot2, self.feeder)]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join(timeout=2.0)
 
     def _restart(self):
         """Restart the application with same arguments."""
         import subprocess
         self._log("Restarting...")
-        self._save_geometry()
+        self._save_config()  # immediate write - we're about to exit
         self.xbox.stop_polling()
-        self.robot1.disconnect()
-        self.robot2.disconnect()
-        self.feeder.disconnect()
+        self._disconnect_all()
         # Relaunch with same arguments
         subprocess.Popen([sys.executable] + sys.argv, start_new_session=True)
         self.root.destroy()
@@ -1789,11 +2076,9 @@ Sticks not responding:
     def on_close(self):
         """Clean up on window close."""
         self._log("Shutting down...")
-        self._save_geometry()  # Save window position/size
+        self._save_config()  # Save window position/size (immediate)
         self.xbox.stop_polling()
-        self.robot1.disconnect()
-        self.robot2.disconnect()
-        self.feeder.disconnect()
+        self._disconnect_all()
         self.root.destroy()
 
 
@@ -1801,22 +2086,35 @@ Sticks not responding:
 # MAIN ENTRY POINT
 # =============================================================================
 
+PID_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.xbox_toolbox.pid')
+
+
 def kill_previous_instances():
-    """Kill any previous instances of xbox_toolbox.py"""
-    import subprocess
+    """Stop the previous instance recorded in the pidfile, then claim it.
+
+    Asks nicely first (SIGTERM) so the old instance can flush config and
+    close serial ports cleanly, and only escalates to SIGKILL if it is
+    still around after a short grace period.
+    """
     current_pid = os.getpid()
     try:
-        # Find all xbox_toolbox processes
-        result = subprocess.run(['pgrep', '-f', 'xbox_toolbox.py'],
-                                capture_output=True, text=True)
-        pids = result.stdout.strip().split('\n')
-        for pid in pids:
-            if pid and int(pid) != current_pid:
-                try:
-                    os.kill(int(pid), 9)  # SIGKILL
-                except (ProcessLookupError, ValueError):
-                    pass
-    except Exception:
+        with open(PID_FILE, 'r') as f:
+            old_pid = int(f.read().strip())
+        if old_pid != current_pid:
+            os.kill(old_pid, 15)  # SIGTERM
+            # The old instance isn't our child, so poll with signal 0
+            # instead of waitpid to see when it exits
+            deadline = time.monotonic() + 1.0
+            while time.monotonic() < deadline:
+                os.kill(old_pid, 0)  # raises ProcessLookupError once gone
+                time.sleep(0.05)
+            os.kill(old_pid, 9)  # SIGKILL - grace period expired
+    except (OSError, ValueError, ProcessLookupError):
+        pass  # no pidfile, stale/garbage contents, or already gone
+    try:
+        with open(PID_FILE, 'w') as f:
+            f.write(str(current_pid))
+    except OSError:
         pass
 
 